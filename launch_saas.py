@@ -141,7 +141,8 @@ def create_admin_user():
     cmd = f"""
 from src.saas_app import app
 from src.auth.auth_manager import AuthManager
-with app.app_context():
+from src.models.base import transaction
+with app.app_context(), transaction():
     user, error = AuthManager.register_user(
         email='{email}',
         password='{password}',
@@ -119,21 +119,21 @@ def create_backtest_config(args) -> BacktestConfig:
 def create_strategy_config(args) -> EnhancedTradingConfig:
     """Create strategy configuration from arguments"""
     
-    config = EnhancedTradingConfig()
-    
     # Apply command line parameters
-    config.trading_pair = args.pair
-    config.rsi_period = args.rsi_period
-    config.rsi_oversold = args.rsi_oversold
-    config.rsi_overbought = args.rsi_overbought
-    config.ema_short = args.ema_short
-    config.ema_medium = args.ema_medium
-    config.ema_long = args.ema_long
-    config.max_position_size_percent = args.position_size
-    config.base_stop_loss_percent = args.stop_loss
-    config.base_take_profit_percent = args.take_profit
-    config.min_confidence_buy = args.min_confidence
-    config.min_confidence_sell = args.min_confidence
+    config = EnhancedTradingConfig(
+        trading_pair=args.pair,
+        rsi_period=args.rsi_period,
+        rsi_oversold=args.rsi_oversold,
+        rsi_overbought=args.rsi_overbought,
+        ema_short=args.ema_short,
+        ema_medium=args.ema_medium,
+        ema_long=args.ema_long,
+        max_position_size_percent=args.position_size,
+        base_stop_loss_percent=args.stop_loss,
+        base_take_profit_percent=args.take_profit,
+        min_confidence_buy=args.min_confidence,
+        min_confidence_sell=args.min_confidence,
+    )
     
     return config
 
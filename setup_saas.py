@@ -126,9 +126,10 @@ sys.path.append(os.getcwd())
 
 from src.saas_app import create_app
 from src.auth.auth_manager import AuthManager
+from src.models.base import transaction
 
 app = create_app()
-with app.app_context():
+with app.app_context(), transaction():
     user, error = AuthManager.register_user(
         email='{email}',
         password='{password}',
@@ -3,12 +3,21 @@ Luno API Client for Trading Bot
 """
 
 import requests
+from requests.adapters import HTTPAdapter
 from requests.auth import HTTPBasicAuth
+from urllib3.util.retry import Retry
 from typing import Dict, List, Optional, Tuple
 import logging
 import time
 from datetime import datetime, timedelta
 
+try:
+    import orjson
+
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 logger = logging.getLogger(__name__)
 
 
@@ -23,6 +32,16 @@ class LunoAPIClient:
         self.base_url = base_url
         self.session = requests.Session()
 
+        # Reuse keep-alive connections across trading cycles; only idempotent
+        # requests are retried (urllib3 excludes POST by default)
+        adapter = HTTPAdapter(
+            pool_connections=4,
+            pool_maxsize=4,
+            max_retries=Retry(total=3, backoff_factor=0.2),
+        )
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+
         # Enhanced credential validation for debugging
         if not api_key or not api_secret:
             raise ValueError("API key and secret are required")
@@ -67,7 +86,7 @@ class LunoAPIClient:
         auth = None
         if authenticated:
             auth = self._get_auth()
-            logger.debug(f"Making authenticated request to {endpoint}")
+            logger.debug("Making authenticated request to %s", endpoint)
 
         try:
             if method.upper() == "GET":
@@ -82,6 +101,8 @@ class LunoAPIClient:
                 raise ValueError(f"Unsupported HTTP method: {method}")
 
             response.raise_for_status()
+            if ORJSON_AVAILABLE:
+                return orjson.loads(response.content)
             return response.json()
 
         except requests.exceptions.RequestException as e:
@@ -24,7 +24,7 @@ def get_invoices():
         per_page = request.args.get('per_page', 20, type=int)
         status = request.args.get('status')
         
-        query = Invoice.query.filter_by(user_id=user.id)
+        query = Invoice.summaries().filter_by(user_id=user.id)
         
         if status:
             query = query.filter_by(status=status)
@@ -34,7 +34,7 @@ def get_invoices():
         )
         
         return jsonify({
-            'invoices': [invoice.to_dict() for invoice in invoices.items],
+            'invoices': [Invoice.summary_dict(invoice) for invoice in invoices.items],
             'pagination': {
                 'page': page,
                 'per_page': per_page,
@@ -56,6 +56,7 @@ def get_invoice(invoice_id):
     """Get specific invoice"""
     try:
         user = g.current_user
+        # line_items is served from the cache when possible, so leave it deferred
         invoice = Invoice.query.filter_by(id=invoice_id, user_id=user.id).first()
         
         if not invoice:
@@ -79,12 +80,12 @@ def get_payments():
         page = request.args.get('page', 1, type=int)
         per_page = request.args.get('per_page', 20, type=int)
         
-        payments = Payment.query.filter_by(user_id=user.id).order_by(
+        payments = Payment.summaries().filter_by(user_id=user.id).order_by(
             Payment.created_at.desc()
         ).paginate(page=page, per_page=per_page, error_out=False)
         
         return jsonify({
-            'payments': [payment.to_dict() for payment in payments.items],
+            'payments': [Payment.summary_dict(payment) for payment in payments.items],
             'pagination': {
                 'page': page,
                 'per_page': per_page,
@@ -219,7 +220,7 @@ def admin_get_invoices():
         status = request.args.get('status')
         user_id = request.args.get('user_id', type=int)
         
-        query = Invoice.query
+        query = Invoice.summaries()
         
         if status:
             query = query.filter_by(status=status)
@@ -232,7 +233,7 @@ def admin_get_invoices():
         )
         
         return jsonify({
-            'invoices': [invoice.to_dict() for invoice in invoices.items],
+            'invoices': [Invoice.summary_dict(invoice) for invoice in invoices.items],
             'pagination': {
                 'page': page,
                 'per_page': per_page,
@@ -258,7 +259,7 @@ def admin_get_payments():
         status = request.args.get('status')
         user_id = request.args.get('user_id', type=int)
         
-        query = Payment.query
+        query = Payment.summaries()
         
         if status:
             query = query.filter_by(status=status)
@@ -271,7 +272,7 @@ def admin_get_payments():
         )
         
         return jsonify({
-            'payments': [payment.to_dict() for payment in payments.items],
+            'payments': [Payment.summary_dict(payment) for payment in payments.items],
             'pagination': {
                 'page': page,
                 'per_page': per_page,
@@ -18,7 +18,7 @@ subscriptions_bp = Blueprint('subscriptions', __name__, url_prefix='/subscriptio
 def get_plans():
     """Get all available subscription plans"""
     try:
-        plans = SubscriptionPlan.query.filter_by(is_active=True).all()
+        plans = SubscriptionPlan.with_features().filter_by(is_active=True).all()
         
         return jsonify({
             'plans': [plan.to_dict() for plan in plans]
@@ -284,7 +284,7 @@ def list_subscriptions():
         status = request.args.get('status')
         plan_name = request.args.get('plan')
         
-        query = Subscription.query
+        query = Subscription.with_plan()
         
         if status:
             query = query.filter_by(status=status)
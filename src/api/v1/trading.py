@@ -47,10 +47,10 @@ def create_trading_config():
         
         # Check if user can create more configs based on subscription
         if user.subscription:
-            max_pairs = user.subscription.get_feature_value('max_pairs')
-            if max_pairs != 'unlimited':
+            max_pairs = user.subscription.plan.max_pairs
+            if max_pairs is not None:
                 current_pairs = len(set(config.trading_pair for config in user.trading_configs))
-                if current_pairs >= int(max_pairs):
+                if current_pairs >= max_pairs:
                     return jsonify({
                         'error': 'Trading pair limit reached',
                         'message': f'Your plan allows maximum {max_pairs} trading pairs'
@@ -220,7 +220,7 @@ def create_bot():
         
         # Check if user can create more bots based on subscription
         if user.subscription and not user.subscription.can_create_bot():
-            max_bots = user.subscription.get_feature_value('max_bots')
+            max_bots = user.subscription.plan.max_bots
             return jsonify({
                 'error': 'Bot limit reached',
                 'message': f'Your plan allows maximum {max_bots} trading bots'
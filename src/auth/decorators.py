@@ -73,7 +73,7 @@ def subscription_required(required_plans=None):
                         'message': 'This feature requires a paid subscription'
                     }), 402
                 
-                if not user.subscription.is_active():
+                if not user.subscription.is_active:
                     return jsonify({
                         'error': 'Subscription expired',
                         'message': 'Your subscription has expired. Please renew to continue.'
@@ -6,10 +6,9 @@ Automated parameter tuning and optimization
 import logging
 import numpy as np
 from datetime import datetime
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, fields, replace
 from typing import Dict, List, Optional, Tuple, Any
 from itertools import product
-from copy import deepcopy
 
 from src.config.enhanced_settings import EnhancedTradingConfig
 from .backtest_engine import BacktestEngine, BacktestConfig, BacktestMode
@@ -133,9 +132,7 @@ class StrategyOptimizer:
         best_params, best_results, best_score = max(all_results, key=lambda x: x[2])
         
         # Create best configuration
-        best_config = deepcopy(self.base_config)
-        for param_name, param_value in best_params.items():
-            setattr(best_config, param_name, param_value)
+        best_config = replace(self.base_config, **best_params)
         
         # Create optimization result
         optimization_result = OptimizationResult(
@@ -194,12 +191,14 @@ class StrategyOptimizer:
         
         try:
             # Create configuration with new parameters
-            config = deepcopy(self.base_config)
+            config_fields = {f.name for f in fields(self.base_config)}
+            overrides = {}
             for param_name, param_value in params.items():
-                if hasattr(config, param_name):
-                    setattr(config, param_name, param_value)
+                if param_name in config_fields:
+                    overrides[param_name] = param_value
                 else:
                     logger.warning(f"Parameter {param_name} not found in config")
+            config = replace(self.base_config, **overrides)
             
             # Run backtest
             engine = BacktestEngine(self.backtest_config)
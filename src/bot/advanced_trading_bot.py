@@ -3,6 +3,7 @@ Advanced Trading Bot Engine
 Next-generation trading bot with comprehensive features and multi-pair support
 """
 
+import os
 import time
 import logging
 import json
@@ -13,10 +14,11 @@ import signal
 import sys
 import threading
 from dataclasses import asdict
-from dotenv import load_dotenv
 
 # Ensure environment variables are loaded
-load_dotenv()
+from src.config._common import load_environment
+
+load_environment()
 
 from src.config.enhanced_settings import EnhancedTradingConfig
 from src.config.strategy_templates import ConfigurationManager, StrategyTemplateManager
@@ -25,7 +27,7 @@ from src.bot.multi_timeframe_analyzer import MultiTimeFrameAnalyzer, TimeFrame
 from src.bot.portfolio_manager import MultiPairPortfolioManager, AllocationStrategy
 from src.api.luno_client import LunoAPIClient, TradingPortfolio
 from src.notifications.notification_manager import NotificationManager, NotificationConfig, Notification, NotificationType, NotificationPriority
-from src.database.database_manager import DatabaseManager, TradeRecord, PerformanceRecord, MarketDataRecord
+from src.database.database_manager import get_database_manager, TradeRecord, PerformanceRecord, MarketDataRecord
 
 logger = logging.getLogger(__name__)
 
@@ -55,7 +57,7 @@ class AdvancedTradingBot:
             self.notification_manager = None
         
         # Initialize database
-        self.db_manager = DatabaseManager()
+        self.db_manager = get_database_manager()
         
         # Initialize configuration management
         self.config_manager = ConfigurationManager()
@@ -3,6 +3,7 @@ Enhanced Trading Bot Engine
 Advanced cryptocurrency trading bot with improved strategy and risk management
 """
 
+import os
 import time
 import logging
 import json
@@ -12,10 +13,11 @@ import signal
 import sys
 import threading
 from dataclasses import asdict
-from dotenv import load_dotenv
 
 # Ensure environment variables are loaded
-load_dotenv()
+from src.config._common import load_environment
+
+load_environment()
 
 from src.config.enhanced_settings import (
     EnhancedTradingConfig,
@@ -86,20 +88,18 @@ class EnhancedRiskManager:
             self.last_reset_date = current_date
 
         # Check daily trade limit
-        if self.daily_trades >= RISK_MANAGEMENT_RULES["daily_limits"]["max_trades"]:
+        if self.daily_trades >= RISK_MANAGEMENT_RULES.daily_limits.max_trades:
             logger.warning("Daily trade limit reached")
             return False
 
         # Check daily loss limit
-        max_daily_loss = RISK_MANAGEMENT_RULES["daily_limits"]["max_loss_percent"]
+        max_daily_loss = RISK_MANAGEMENT_RULES.daily_limits.max_loss_percent
         if self.daily_pnl < -max_daily_loss:
             logger.warning(f"Daily loss limit exceeded: {self.daily_pnl:.2f}%")
             return False
 
         # Check consecutive losses
-        max_consecutive = RISK_MANAGEMENT_RULES["daily_limits"][
-            "max_consecutive_losses"
-        ]
+        max_consecutive = RISK_MANAGEMENT_RULES.daily_limits.max_consecutive_losses
         if self.consecutive_losses >= max_consecutive:
             logger.warning(
                 f"Maximum consecutive losses reached: {self.consecutive_losses}"
@@ -114,16 +114,16 @@ class EnhancedRiskManager:
         """Calculate position size based on signal strength and risk parameters"""
 
         # Base position size
-        base_percent = RISK_MANAGEMENT_RULES["position_sizing"]["base_percent"]
+        base_percent = RISK_MANAGEMENT_RULES.position_sizing.base_percent
         base_size = portfolio_value * (base_percent / 100)
 
         # Adjust for signal confidence
-        if RISK_MANAGEMENT_RULES["position_sizing"]["confidence_scaling"]:
+        if RISK_MANAGEMENT_RULES.position_sizing.confidence_scaling:
             confidence_multiplier = 0.5 + (signal.confidence * 0.5)  # 0.5 to 1.0
             base_size *= confidence_multiplier
 
         # Adjust for volatility
-        if RISK_MANAGEMENT_RULES["position_sizing"]["volatility_adjustment"]:
+        if RISK_MANAGEMENT_RULES.position_sizing.volatility_adjustment:
             base_size *= signal.position_size_multiplier
 
         # Apply signal-specific multiplier
@@ -258,8 +258,8 @@ class EnhancedTradingBot:
             )
 
         pair_info = ENHANCED_SUPPORTED_PAIRS[self.config.trading_pair]
-        logger.info(f"Trading pair validated: {pair_info['name']}")
-        logger.info(f"Volatility class: {pair_info['volatility_class']}")
+        logger.info(f"Trading pair validated: {pair_info.name}")
+        logger.info(f"Volatility class: {pair_info.volatility_class}")
 
     def _signal_handler(self, signum, frame):
         """Handle shutdown signals"""
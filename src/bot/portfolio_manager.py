@@ -173,8 +173,8 @@ class MultiPairPortfolioManager:
                 current_price = float(ticker.get("last_trade", 0))
                 
                 # Use pair characteristics to estimate volatility
-                pair_info = ENHANCED_SUPPORTED_PAIRS.get(pair, {})
-                volatility_class = pair_info.get("volatility_class", "medium")
+                pair_info = ENHANCED_SUPPORTED_PAIRS.get(pair)
+                volatility_class = pair_info.volatility_class if pair_info else "medium"
                 
                 if volatility_class == "high":
                     base_vol = 0.04  # 4% daily volatility
@@ -9,9 +9,65 @@ from dataclasses import dataclass
 from datetime import datetime, timedelta
 import logging
 
+try:
+    from numba import njit
+
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+    def njit(*args, **kwargs):
+        """No-op stand-in for numba.njit when numba is not installed"""
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda func: func
+
+
 logger = logging.getLogger(__name__)
 
 
+@njit(cache=True)
+def _rsi_loop(prices: np.ndarray, period: int) -> float:
+    """RSI from the average gain/loss over the last `period` price changes"""
+    n = prices.shape[0]
+    gain = 0.0
+    loss = 0.0
+    for i in range(n - period, n):
+        delta = prices[i] - prices[i - 1]
+        if delta > 0:
+            gain += delta
+        else:
+            loss -= delta
+
+    if loss == 0:
+        return 100.0
+
+    rs = gain / loss
+    return 100.0 - (100.0 / (1.0 + rs))
+
+
+@njit(cache=True)
+def _ema_loop(prices: np.ndarray, alpha: float) -> float:
+    """Exponential moving average seeded with the first price"""
+    ema = prices[0]
+    for i in range(1, prices.shape[0]):
+        ema = alpha * prices[i] + (1.0 - alpha) * ema
+    return ema
+
+
+@njit(cache=True)
+def _macd_loop(prices: np.ndarray, fast: int, slow: int) -> Tuple[float, float]:
+    """Fast and slow EMAs computed in a single pass"""
+    alpha_fast = 2.0 / (fast + 1)
+    alpha_slow = 2.0 / (slow + 1)
+    ema_fast = prices[0]
+    ema_slow = prices[0]
+    for i in range(1, prices.shape[0]):
+        ema_fast = alpha_fast * prices[i] + (1.0 - alpha_fast) * ema_fast
+        ema_slow = alpha_slow * prices[i] + (1.0 - alpha_slow) * ema_slow
+    return ema_fast, ema_slow
+
+
 @dataclass
 class TechnicalIndicators:
     """Container for technical analysis results"""
@@ -36,25 +92,21 @@ class TechnicalAnalyzer:
     def __init__(self, config):
         self.config = config
 
+        # Indicator state over closed candles, advanced per tick by update_tick
+        self._ema_state: Dict[int, float] = {}
+        self._rsi_state: Dict[str, float] = {}
+        self._macd_state: Dict[str, float] = {}
+        self._bb_state: Dict[str, float] = {}
+        self._closes_state: Dict[str, float] = {}
+        self._volume_sma = 0.0
+        self._state_key = None
+
     def calculate_rsi(self, prices: List[float], period: int = 14) -> float:
         """Calculate Relative Strength Index"""
         if len(prices) < period + 1:
             return 50.0  # Neutral RSI if insufficient data
 
-        prices_array = np.array(prices)
-        deltas = np.diff(prices_array)
-
-        gains = np.where(deltas > 0, deltas, 0)
-        losses = np.where(deltas < 0, -deltas, 0)
-
-        avg_gain = np.mean(gains[-period:])
-        avg_loss = np.mean(losses[-period:])
-
-        if avg_loss == 0:
-            return 100.0
-
-        rs = avg_gain / avg_loss
-        rsi = 100 - (100 / (1 + rs))
+        rsi = _rsi_loop(np.asarray(prices, dtype=np.float64), period)
 
         return round(rsi, 2)
 
@@ -63,12 +115,8 @@ class TechnicalAnalyzer:
         if len(prices) < period:
             return np.mean(prices)
 
-        prices_array = np.array(prices)
         alpha = 2 / (period + 1)
-
-        ema = prices_array[0]
-        for price in prices_array[1:]:
-            ema = alpha * price + (1 - alpha) * ema
+        ema = _ema_loop(np.asarray(prices, dtype=np.float64), alpha)
 
         return round(ema, 2)
 
@@ -96,10 +144,11 @@ class TechnicalAnalyzer:
         if len(prices) < slow:
             return 0.0, 0.0, 0.0
 
-        ema_fast = self.calculate_ema(prices, fast)
-        ema_slow = self.calculate_ema(prices, slow)
+        ema_fast, ema_slow = _macd_loop(
+            np.asarray(prices, dtype=np.float64), fast, slow
+        )
 
-        macd_line = ema_fast - ema_slow
+        macd_line = round(ema_fast, 2) - round(ema_slow, 2)
 
         # For signal line, we need MACD history - simplified version
         signal_line = macd_line * 0.8  # Simplified calculation
@@ -112,11 +161,14 @@ class TechnicalAnalyzer:
     ) -> TechnicalIndicators:
         """Perform comprehensive technical analysis"""
 
-        # Extract price data
-        closes = [float(candle["close"]) for candle in candles]
-        highs = [float(candle["high"]) for candle in candles]
-        lows = [float(candle["low"]) for candle in candles]
-        volumes = [float(candle["volume"]) for candle in candles]
+        # Extract price data into contiguous arrays for the indicator kernels
+        count = len(candles)
+        closes = np.fromiter(
+            (float(candle["close"]) for candle in candles), np.float64, count
+        )
+        volumes = np.fromiter(
+            (float(candle["volume"]) for candle in candles), np.float64, count
+        )
 
         # Calculate all indicators
         rsi = self.calculate_rsi(closes, self.config.rsi_period)
@@ -143,6 +195,115 @@ class TechnicalAnalyzer:
             timestamp=datetime.now(),
         )
 
+    def needs_state_refresh(self, candles: List[Dict]) -> bool:
+        """Check whether the candle window changed since the state was seeded"""
+        key = (len(candles), candles[-1]["timestamp"]) if candles else None
+        return self._state_key is None or key != self._state_key
+
+    def seed_indicator_state(self, candles: List[Dict]):
+        """Rebuild incremental indicator state from the closed candles"""
+        count = len(candles)
+        closes = np.fromiter(
+            (float(candle["close"]) for candle in candles), np.float64, count
+        )
+        volumes = np.fromiter(
+            (float(candle["volume"]) for candle in candles), np.float64, count
+        )
+
+        self._closes_state = {
+            "count": count,
+            "sum": float(closes.sum()),
+            "last": float(closes[-1]) if count else 0.0,
+        }
+
+        self._ema_state = {}
+        if count:
+            for period in (self.config.ema_short, self.config.ema_long):
+                self._ema_state[period] = _ema_loop(closes, 2 / (period + 1))
+            ema_fast, ema_slow = _macd_loop(closes, 12, 26)
+            self._macd_state = {"fast": ema_fast, "slow": ema_slow}
+
+        # RSI keeps the gains/losses of the last (period - 1) closed changes;
+        # the live price supplies the final change of the window
+        period = self.config.rsi_period
+        deltas = np.diff(closes)[-(period - 1) :] if period > 1 else closes[:0]
+        self._rsi_state = {
+            "gain": float(deltas[deltas > 0].sum()),
+            "loss": float(-deltas[deltas < 0].sum()),
+        }
+
+        # Bollinger Bands keep the running sums of the last 19 closes
+        window = closes[-19:]
+        self._bb_state = {
+            "sum": float(window.sum()),
+            "sumsq": float(np.dot(window, window)),
+            "count": len(window),
+        }
+
+        self._volume_sma = float(np.mean(volumes[-7:])) if count else float("nan")
+        self._state_key = (count, candles[-1]["timestamp"]) if candles else None
+
+    def update_tick(self, current_price: float) -> TechnicalIndicators:
+        """Fold the live price into the seeded state as the forming candle.
+
+        Runs in O(1) per cycle; seed_indicator_state must be called first and
+        again whenever needs_state_refresh reports a new candle window.
+        """
+        closes = self._closes_state
+        length = closes["count"] + 1
+        series_mean = (closes["sum"] + current_price) / length
+
+        def ema(period: int) -> float:
+            if length < period:
+                return series_mean
+            alpha = 2 / (period + 1)
+            return alpha * current_price + (1 - alpha) * self._ema_state[period]
+
+        # RSI
+        period = self.config.rsi_period
+        if length < period + 1:
+            rsi = 50.0
+        else:
+            delta = current_price - closes["last"]
+            gain = self._rsi_state["gain"] + max(delta, 0.0)
+            loss = self._rsi_state["loss"] + max(-delta, 0.0)
+            rsi = 100.0 if loss == 0 else 100 - (100 / (1 + gain / loss))
+
+        # Bollinger Bands (20, 2.0)
+        if length < 20:
+            bb_upper = bb_middle = bb_lower = series_mean
+        else:
+            bb = self._bb_state
+            sma = (bb["sum"] + current_price) / 20
+            variance = (bb["sumsq"] + current_price * current_price) / 20 - sma**2
+            std = max(variance, 0.0) ** 0.5
+            bb_upper, bb_middle, bb_lower = sma + 2.0 * std, sma, sma - 2.0 * std
+
+        # MACD (12, 26) with the same simplified signal line as calculate_macd
+        if length < 26:
+            macd_line = 0.0
+        else:
+            macd = self._macd_state
+            ema_fast = (2 / 13) * current_price + (11 / 13) * macd["fast"]
+            ema_slow = (2 / 27) * current_price + (25 / 27) * macd["slow"]
+            macd_line = round(ema_fast, 2) - round(ema_slow, 2)
+        macd_signal = macd_line * 0.8
+
+        return TechnicalIndicators(
+            rsi=round(rsi, 2),
+            ema_short=round(ema(self.config.ema_short), 2),
+            ema_long=round(ema(self.config.ema_long), 2),
+            bollinger_upper=round(bb_upper, 2),
+            bollinger_middle=round(bb_middle, 2),
+            bollinger_lower=round(bb_lower, 2),
+            macd=round(macd_line, 2),
+            macd_signal=round(macd_signal, 2),
+            macd_histogram=round(macd_line - macd_signal, 2),
+            volume_sma=self._volume_sma,
+            current_price=current_price,
+            timestamp=datetime.now(),
+        )
+
     def generate_signals(
         self, indicators: TechnicalIndicators, current_volume: float
     ) -> Dict[str, any]:
@@ -2,6 +2,7 @@
 Main Trading Bot Engine
 """
 
+import os
 import time
 import logging
 import json
@@ -10,11 +11,13 @@ from typing import Dict, List, Optional
 import signal
 import sys
 import threading
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import asdict
-from dotenv import load_dotenv
 
 # Ensure environment variables are loaded
-load_dotenv()
+from src.config._common import load_environment
+
+load_environment()
 
 from src.config.settings import (
     TradingConfig,
@@ -34,8 +37,6 @@ def setup_logging():
     # Try to create file handler with proper error handling
     try:
         # Ensure logs directory exists
-        import os
-
         log_dir = "logs"
         if not os.path.exists(log_dir):
             os.makedirs(log_dir, exist_ok=True)
@@ -73,7 +74,9 @@ class TradingBot:
 
     def __init__(self, config: TradingConfig):
         self.config = config
+        self._config_dict = asdict(config)
         self.running = False
+        self._stopping = False
 
         # Validate trading pair
         self._validate_trading_pair()
@@ -82,13 +85,21 @@ class TradingBot:
         self.portfolio = TradingPortfolio(self.client, config)
         self.analyzer = TechnicalAnalyzer(config)
 
+        # Worker pool for issuing independent market data requests concurrently
+        self._io_pool = ThreadPoolExecutor(max_workers=2)
+
         # Trading state
         self.daily_trades = 0
+        self._trade_day = datetime.now().date()
         self.last_trade_time = None
         self.current_position = None
         self.stop_loss_order = None
         self.take_profit_order = None
 
+        # Candle window start, refreshed once per day
+        self._since_date = None
+        self._since_ms = 0
+
         # Performance tracking
         self.trades_history = []
         self.performance_stats = {
@@ -100,9 +111,11 @@ class TradingBot:
             "last_update": datetime.now(),
         }
 
-        # Setup signal handlers for graceful shutdown
-        signal.signal(signal.SIGINT, self._signal_handler)
-        signal.signal(signal.SIGTERM, self._signal_handler)
+        # Setup signal handlers for graceful shutdown (only possible from the
+        # main thread; bots built in worker threads are stopped explicitly)
+        if threading.current_thread() is threading.main_thread():
+            signal.signal(signal.SIGINT, self._signal_handler)
+            signal.signal(signal.SIGTERM, self._signal_handler)
 
         logger.info("Luno Trading Bot initialized")
         logger.info(f"Dry run mode: {config.dry_run}")
@@ -150,22 +163,45 @@ class TradingBot:
             self.stop()
 
     def stop(self):
-        """Stop the trading bot"""
+        """Stop the trading bot (safe to call more than once)"""
+        # A second SIGINT or the crash path must not cancel orders again
+        if self._stopping:
+            return
+        self._stopping = True
+
         logger.info("Stopping Trading Bot...")
         self.running = False
 
+        # Save performance report on its own thread while orders are cancelled;
+        # the I/O pool may still be busy with this cycle's market data fetches
+        report_thread = threading.Thread(
+            target=self._save_performance_report, name="performance-report"
+        )
+        report_thread.start()
+
         # Cancel all open orders
         if not self.config.dry_run:
             cancelled = self.portfolio.cancel_all_orders()
             logger.info(f"Cancelled {cancelled} open orders")
 
-        # Save performance report
-        self._save_performance_report()
+        # Non-daemon, so a report still saving after the wait finishes
+        # before the interpreter exits
+        report_thread.join(10)
+        if report_thread.is_alive():
+            logger.warning("Performance report still saving, continuing shutdown")
+
+        self._io_pool.shutdown(wait=False, cancel_futures=True)
         logger.info("Trading Bot stopped")
 
     def _trading_cycle(self):
         """Execute one trading cycle"""
         try:
+            # Reset the daily trade counter when the date rolls over
+            today = datetime.now().date()
+            if today != self._trade_day:
+                self.daily_trades = 0
+                self._trade_day = today
+
             # Check if within trading hours
             if not self._is_trading_hours():
                 logger.debug("Outside trading hours, skipping cycle")
@@ -206,17 +242,23 @@ class TradingBot:
     def _get_market_data(self) -> Optional[Dict]:
         """Fetch current market data"""
         try:
-            # Get current price
-            ticker = self.client.get_ticker(self.config.trading_pair)
+            # Fetch current price and historical candles concurrently
+            since = self._get_candles_since()
+            ticker_future = self._io_pool.submit(
+                self.client.get_ticker, self.config.trading_pair
+            )
+            candles_future = self._io_pool.submit(
+                self.client.get_candles,
+                self.config.trading_pair,
+                86400,  # 24h candles
+                since,
+            )
+            ticker = ticker_future.result()
+            candles_data = candles_future.result()
+
             current_price = float(ticker["last_trade"])
             current_volume = float(ticker.get("rolling_24_hour_volume", 0))
 
-            # Get historical candles for analysis
-            since = int((datetime.now() - timedelta(days=30)).timestamp() * 1000)
-            candles_data = self.client.get_candles(
-                self.config.trading_pair, 86400, since  # 24h candles
-            )
-
             return {
                 "current_price": current_price,
                 "current_volume": current_volume,
@@ -228,16 +270,25 @@ class TradingBot:
             logger.error(f"Failed to get market data: {e}")
             return None
 
+    def _get_candles_since(self) -> int:
+        """Get the 30-day candle window start, recomputed only on day rollover"""
+        now = datetime.now()
+        today = now.date()
+        if today != self._since_date:
+            self._since_ms = int((now - timedelta(days=30)).timestamp() * 1000)
+            self._since_date = today
+        return self._since_ms
+
     def _analyze_market(self, market_data: Dict) -> Optional[TechnicalIndicators]:
         """Perform technical analysis on market data"""
         try:
-            volume_data = [float(candle["volume"]) for candle in market_data["candles"]]
+            # Full recompute only when the candle window changes; otherwise the
+            # live price is folded into the existing indicator state
+            candles = market_data["candles"]
+            if self.analyzer.needs_state_refresh(candles):
+                self.analyzer.seed_indicator_state(candles)
 
-            indicators = self.analyzer.analyze_market_data(
-                market_data["candles"], market_data["current_price"], volume_data
-            )
-
-            return indicators
+            return self.analyzer.update_tick(market_data["current_price"])
 
         except Exception as e:
             logger.error(f"Failed to analyze market: {e}")
@@ -254,21 +305,21 @@ class TradingBot:
             return
 
         # Check daily trade limit
-        if self.daily_trades >= self.config.max_daily_trades:
-            logger.info(f"Daily trade limit reached ({self.config.max_daily_trades})")
+        max_daily_trades = self.config.max_daily_trades
+        if self.daily_trades >= max_daily_trades:
+            logger.info(f"Daily trade limit reached ({max_daily_trades})")
             return
 
         # Calculate position size
-        volume, volume_str = self.portfolio.calculate_position_size(
-            current_price, action
-        )
+        portfolio = self.portfolio
+        volume, volume_str = portfolio.calculate_position_size(current_price, action)
 
         if volume <= 0:
             logger.warning("Calculated position size is zero")
             return
 
         # Check sufficient balance
-        if not self.portfolio.has_sufficient_balance(action, volume, current_price):
+        if not portfolio.has_sufficient_balance(action, volume, current_price):
             logger.warning(f"Insufficient balance for {action} order")
             return
 
@@ -346,7 +397,9 @@ class TradingBot:
         min_confidence = 0.7
         if confidence < min_confidence:
             logger.debug(
-                f"Confidence {confidence:.1%} below threshold {min_confidence:.1%}"
+                "Confidence %.1f%% below threshold %.1f%%",
+                confidence * 100,
+                min_confidence * 100,
             )
             return False
 
@@ -475,7 +528,7 @@ class TradingBot:
         """Save performance report to file"""
 
         report = {
-            "bot_config": asdict(self.config),
+            "bot_config": self._config_dict,
             "performance_stats": self.performance_stats,
             "trades_history": self.trades_history,
             "generated_at": datetime.now().isoformat(),
@@ -0,0 +1,84 @@
+"""
+Shared configuration lookup tables and helpers
+"""
+
+from types import MappingProxyType
+from typing import Mapping, Tuple
+
+from dotenv import load_dotenv
+
+# Set once .env has been read into os.environ by this process
+_env_loaded = False
+
+
+def load_environment() -> None:
+    """Load variables from .env into os.environ, once per process.
+
+    Variables already set in the environment take precedence.
+    """
+    global _env_loaded
+    if not _env_loaded:
+        load_dotenv()
+        _env_loaded = True
+
+
+# Common Luno trading pairs mapped to (base, counter) currencies
+PAIR_MAP: Mapping[str, Tuple[str, str]] = MappingProxyType(
+    {
+        "XBTMYR": ("XBT", "MYR"),
+        "XBTZAR": ("XBT", "ZAR"),
+        "XBTEUR": ("XBT", "EUR"),
+        "XBTGBP": ("XBT", "GBP"),
+        "XBTNGN": ("XBT", "NGN"),
+        "XBTUGX": ("XBT", "UGX"),
+        "ETHMYR": ("ETH", "MYR"),
+        "ETHZAR": ("ETH", "ZAR"),
+        "ETHXBT": ("ETH", "XBT"),
+        "LTCMYR": ("LTC", "MYR"),
+        "LTCZAR": ("LTC", "ZAR"),
+        "LTCXBT": ("LTC", "XBT"),
+        "BCHMYR": ("BCH", "MYR"),
+        "BCHZAR": ("BCH", "ZAR"),
+        "BCHXBT": ("BCH", "XBT"),
+    }
+)
+# Preferred trading timezone per pair, shared by both trading hours configs
+PAIR_TIMEZONES: Mapping[str, Mapping[str, str]] = MappingProxyType(
+    {
+        "XBTMYR": {"timezone": "Asia/Kuala_Lumpur"},
+        "XBTZAR": {"timezone": "Africa/Johannesburg"},
+        "XBTEUR": {"timezone": "Europe/London"},
+        "XBTGBP": {"timezone": "Europe/London"},
+    }
+)
+
+# Known base currencies, longest first so prefix matching prefers e.g. USDC
+# over a shorter code sharing the same prefix
+_BASE_CURRENCIES: Tuple[str, ...] = tuple(
+    sorted(
+        ("XBT", "ETH", "LTC", "BCH", "XRP", "ADA", "SOL", "DOT", "UNI")
+        + ("LINK", "AVAX", "USDC", "USDT"),
+        key=len,
+        reverse=True,
+    )
+)
+
+
+def parse_trading_pair(pair: str) -> Tuple[str, str]:
+    """Parse trading pair string to extract base and counter currencies"""
+    parsed = PAIR_MAP.get(pair)
+    if parsed:
+        return parsed
+
+    # Longest-prefix match against known base currencies. The remainder must
+    # still look like a currency code, so e.g. USDCAD is not read as USDC/AD
+    for base in _BASE_CURRENCIES:
+        if pair.startswith(base) and len(pair) - len(base) >= 3:
+            return base, pair[len(base) :]
+
+    # Fallback: try to parse manually (assumes 3-letter currencies)
+    if len(pair) == 6:
+        return pair[:3], pair[3:]
+
+    # Default fallback
+    return "XBT", "MYR"
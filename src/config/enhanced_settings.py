@@ -5,19 +5,38 @@ Improved settings for the advanced trading strategy
 
 import os
 from dataclasses import dataclass
-from typing import Dict, Any, List
+from types import MappingProxyType
+from typing import Dict, Any, Mapping, NamedTuple, Tuple
 
+from src.config._common import PAIR_TIMEZONES, load_environment, parse_trading_pair
 
-@dataclass
+# Read .env before the snapshot below
+load_environment()
+
+# Environment snapshot taken once at import and shared by the field defaults
+_ENV = {
+    key: os.environ.get(key, default)
+    for key, default in (
+        ("LUNO_API_KEY", ""),
+        ("LUNO_API_SECRET", ""),
+        ("TRADING_PAIR", "XBTMYR"),
+        ("DASHBOARD_HOST", "0.0.0.0"),
+        ("DASHBOARD_PORT", "5003"),
+    )
+}
+_DASHBOARD_PORT = int(_ENV["DASHBOARD_PORT"])
+
+
+@dataclass(frozen=True, slots=True)
 class EnhancedTradingConfig:
     """Enhanced trading bot configuration settings"""
 
     # Luno API Configuration
-    api_key: str = os.getenv("LUNO_API_KEY", "")
-    api_secret: str = os.getenv("LUNO_API_SECRET", "")
+    api_key: str = _ENV["LUNO_API_KEY"]
+    api_secret: str = _ENV["LUNO_API_SECRET"]
 
     # Trading Parameters
-    trading_pair: str = os.getenv("TRADING_PAIR", "XBTMYR")
+    trading_pair: str = _ENV["TRADING_PAIR"]
     base_currency: str = ""
     counter_currency: str = ""
 
@@ -86,10 +105,8 @@ class EnhancedTradingConfig:
     log_level: str = "INFO"
 
     # Dashboard Configuration
-    dashboard_host: str = os.getenv(
-        "DASHBOARD_HOST", "0.0.0.0"
-    )  # Allow external access by default
-    dashboard_port: int = int(os.getenv("DASHBOARD_PORT", "5003"))
+    dashboard_host: str = _ENV["DASHBOARD_HOST"]  # Allow external access by default
+    dashboard_port: int = _DASHBOARD_PORT
 
     # Backtesting and Performance
     track_performance: bool = True
@@ -98,46 +115,16 @@ class EnhancedTradingConfig:
 
     def __post_init__(self):
         """Initialize default values after dataclass creation"""
-        # Parse trading pair to extract base and counter currencies
+        # Parse trading pair to extract base and counter currencies; the config
+        # is frozen, so derived fields are set through object.__setattr__
         if self.trading_pair and not self.base_currency:
-            self.base_currency, self.counter_currency = self._parse_trading_pair(
-                self.trading_pair
-            )
-
-    def _parse_trading_pair(self, pair: str) -> tuple:
-        """Parse trading pair string to extract base and counter currencies"""
-        # Common Luno trading pairs
-        pair_mappings = {
-            "XBTMYR": ("XBT", "MYR"),
-            "XBTZAR": ("XBT", "ZAR"),
-            "XBTEUR": ("XBT", "EUR"),
-            "XBTGBP": ("XBT", "GBP"),
-            "XBTNGN": ("XBT", "NGN"),
-            "XBTUGX": ("XBT", "UGX"),
-            "ETHMYR": ("ETH", "MYR"),
-            "ETHZAR": ("ETH", "ZAR"),
-            "ETHXBT": ("ETH", "XBT"),
-            "LTCMYR": ("LTC", "MYR"),
-            "LTCZAR": ("LTC", "ZAR"),
-            "LTCXBT": ("LTC", "XBT"),
-            "BCHMYR": ("BCH", "MYR"),
-            "BCHZAR": ("BCH", "ZAR"),
-            "BCHXBT": ("BCH", "XBT"),
-        }
-
-        if pair in pair_mappings:
-            return pair_mappings[pair]
-
-        # Fallback: try to parse manually (assumes 3-letter currencies)
-        if len(pair) == 6:
-            return pair[:3], pair[3:]
-
-        # Default fallback
-        return "XBT", "MYR"
+            base_currency, counter_currency = parse_trading_pair(self.trading_pair)
+            object.__setattr__(self, "base_currency", base_currency)
+            object.__setattr__(self, "counter_currency", counter_currency)
 
 
 # Enhanced Trading Signals Configuration
-ENHANCED_TRADING_SIGNALS = {
+ENHANCED_TRADING_SIGNALS: Mapping[str, Dict[str, Any]] = {
     "VERY_STRONG_BUY": {
         "weight": 5,
         "conditions": [
@@ -210,37 +197,84 @@ ENHANCED_TRADING_SIGNALS = {
     },
 }
 
+
 # Enhanced Risk Management Rules
-RISK_MANAGEMENT_RULES = {
-    "position_sizing": {
-        "base_percent": 1.5,  # Base position size as % of portfolio
-        "volatility_adjustment": True,
-        "confidence_scaling": True,  # Scale position with signal confidence
-        "max_portfolio_risk": 5.0,  # Maximum total portfolio risk
-    },
-    "stop_loss": {
-        "method": "dynamic_atr",  # Use ATR-based dynamic stops
-        "min_percent": 2.0,  # Minimum stop loss
-        "max_percent": 6.0,  # Maximum stop loss
-        "trailing_enabled": True,  # Enable trailing stops
-        "breakeven_threshold": 2.0,  # Move to breakeven after 2% profit
-    },
-    "take_profit": {
-        "method": "multiple_targets",  # Use multiple take profit levels
-        "target_1_ratio": 2.0,  # First target at 2:1 RR
-        "target_2_ratio": 3.5,  # Second target at 3.5:1 RR
-        "target_3_ratio": 5.0,  # Third target at 5:1 RR
-        "partial_close_percent": [50, 30, 20],  # Close percentages at each target
-    },
-    "daily_limits": {
-        "max_trades": 5,
-        "max_loss_percent": 3.0,  # Stop trading if daily loss exceeds 3%
-        "max_consecutive_losses": 3,  # Stop after 3 consecutive losses
-    },
-}
+class PositionSizingRules(NamedTuple):
+    """Position sizing limits"""
+
+    base_percent: float  # Base position size as % of portfolio
+    volatility_adjustment: bool
+    confidence_scaling: bool  # Scale position with signal confidence
+    max_portfolio_risk: float  # Maximum total portfolio risk
+
+
+class StopLossRules(NamedTuple):
+    """Stop loss placement rules"""
+
+    method: str  # Use ATR-based dynamic stops
+    min_percent: float  # Minimum stop loss
+    max_percent: float  # Maximum stop loss
+    trailing_enabled: bool  # Enable trailing stops
+    breakeven_threshold: float  # Move to breakeven after this % profit
+
+
+class TakeProfitRules(NamedTuple):
+    """Take profit target rules"""
+
+    method: str  # Use multiple take profit levels
+    target_1_ratio: float  # First target risk-reward ratio
+    target_2_ratio: float  # Second target risk-reward ratio
+    target_3_ratio: float  # Third target risk-reward ratio
+    partial_close_percent: Tuple[int, ...]  # Close percentages at each target
+
+
+class DailyLimits(NamedTuple):
+    """Per-day trading limits"""
+
+    max_trades: int
+    max_loss_percent: float  # Stop trading if daily loss exceeds this %
+    max_consecutive_losses: int  # Stop after this many consecutive losses
+
+
+class RiskManagementRules(NamedTuple):
+    """Complete set of risk management rules"""
+
+    position_sizing: PositionSizingRules
+    stop_loss: StopLossRules
+    take_profit: TakeProfitRules
+    daily_limits: DailyLimits
+
+
+RISK_MANAGEMENT_RULES = RiskManagementRules(
+    position_sizing=PositionSizingRules(
+        base_percent=1.5,
+        volatility_adjustment=True,
+        confidence_scaling=True,
+        max_portfolio_risk=5.0,
+    ),
+    stop_loss=StopLossRules(
+        method="dynamic_atr",
+        min_percent=2.0,
+        max_percent=6.0,
+        trailing_enabled=True,
+        breakeven_threshold=2.0,
+    ),
+    take_profit=TakeProfitRules(
+        method="multiple_targets",
+        target_1_ratio=2.0,  # 2:1 RR
+        target_2_ratio=3.5,  # 3.5:1 RR
+        target_3_ratio=5.0,  # 5:1 RR
+        partial_close_percent=(50, 30, 20),
+    ),
+    daily_limits=DailyLimits(
+        max_trades=5,
+        max_loss_percent=3.0,
+        max_consecutive_losses=3,
+    ),
+)
 
 # Market Regime Configuration
-MARKET_REGIMES = {
+MARKET_REGIMES: Mapping[str, Dict[str, Any]] = {
     "TRENDING_UP": {
         "bias": "bullish",
         "preferred_signals": ["BUY"],
@@ -274,63 +308,75 @@ MARKET_REGIMES = {
     },
 }
 
+
+@dataclass(frozen=True, slots=True)
+class PairSpec:
+    """Static trading characteristics of a supported pair"""
+
+    name: str
+    min_volume: float
+    tick_size: float
+    volatility_class: str
+    preferred_timeframes: Tuple[str, ...]
+
+
 # Supported Luno Trading Pairs (Enhanced)
-ENHANCED_SUPPORTED_PAIRS = {
+ENHANCED_SUPPORTED_PAIRS: Dict[str, PairSpec] = {
     # Bitcoin pairs
-    "XBTMYR": {
-        "name": "Bitcoin/Malaysian Ringgit",
-        "min_volume": 0.0001,
-        "tick_size": 1.0,
-        "volatility_class": "high",
-        "preferred_timeframes": ["1h", "4h", "1d"],
-    },
-    "XBTZAR": {
-        "name": "Bitcoin/South African Rand",
-        "min_volume": 0.0001,
-        "tick_size": 1.0,
-        "volatility_class": "high",
-        "preferred_timeframes": ["1h", "4h", "1d"],
-    },
-    "XBTEUR": {
-        "name": "Bitcoin/Euro",
-        "min_volume": 0.0001,
-        "tick_size": 0.01,
-        "volatility_class": "high",
-        "preferred_timeframes": ["1h", "4h", "1d"],
-    },
-    "XBTGBP": {
-        "name": "Bitcoin/British Pound",
-        "min_volume": 0.0001,
-        "tick_size": 0.01,
-        "volatility_class": "high",
-        "preferred_timeframes": ["1h", "4h", "1d"],
-    },
+    "XBTMYR": PairSpec(
+        name="Bitcoin/Malaysian Ringgit",
+        min_volume=0.0001,
+        tick_size=1.0,
+        volatility_class="high",
+        preferred_timeframes=("1h", "4h", "1d"),
+    ),
+    "XBTZAR": PairSpec(
+        name="Bitcoin/South African Rand",
+        min_volume=0.0001,
+        tick_size=1.0,
+        volatility_class="high",
+        preferred_timeframes=("1h", "4h", "1d"),
+    ),
+    "XBTEUR": PairSpec(
+        name="Bitcoin/Euro",
+        min_volume=0.0001,
+        tick_size=0.01,
+        volatility_class="high",
+        preferred_timeframes=("1h", "4h", "1d"),
+    ),
+    "XBTGBP": PairSpec(
+        name="Bitcoin/British Pound",
+        min_volume=0.0001,
+        tick_size=0.01,
+        volatility_class="high",
+        preferred_timeframes=("1h", "4h", "1d"),
+    ),
     # Ethereum pairs
-    "ETHMYR": {
-        "name": "Ethereum/Malaysian Ringgit",
-        "min_volume": 0.001,
-        "tick_size": 0.1,
-        "volatility_class": "high",
-        "preferred_timeframes": ["1h", "4h", "1d"],
-    },
-    "ETHZAR": {
-        "name": "Ethereum/South African Rand",
-        "min_volume": 0.001,
-        "tick_size": 0.1,
-        "volatility_class": "high",
-        "preferred_timeframes": ["1h", "4h", "1d"],
-    },
-    "ETHXBT": {
-        "name": "Ethereum/Bitcoin",
-        "min_volume": 0.001,
-        "tick_size": 0.00001,
-        "volatility_class": "medium",
-        "preferred_timeframes": ["4h", "1d"],
-    },
+    "ETHMYR": PairSpec(
+        name="Ethereum/Malaysian Ringgit",
+        min_volume=0.001,
+        tick_size=0.1,
+        volatility_class="high",
+        preferred_timeframes=("1h", "4h", "1d"),
+    ),
+    "ETHZAR": PairSpec(
+        name="Ethereum/South African Rand",
+        min_volume=0.001,
+        tick_size=0.1,
+        volatility_class="high",
+        preferred_timeframes=("1h", "4h", "1d"),
+    ),
+    "ETHXBT": PairSpec(
+        name="Ethereum/Bitcoin",
+        min_volume=0.001,
+        tick_size=0.00001,
+        volatility_class="medium",
+        preferred_timeframes=("4h", "1d"),
+    ),
 }
 
 # Trading Hours (Enhanced with timezone support)
-ENHANCED_TRADING_HOURS = {
+ENHANCED_TRADING_HOURS: Dict[str, Any] = {
     "enabled": False,  # Crypto trades 24/7 by default
     "preferred_hours": {
         "start": 8,  # 8 AM
@@ -341,17 +387,39 @@ ENHANCED_TRADING_HOURS = {
         {"start": 14, "end": 16, "description": "European market open"},
         {"start": 21, "end": 23, "description": "US market open"},
     ],
-    "pair_specific": {
-        "XBTMYR": {"timezone": "Asia/Kuala_Lumpur"},
-        "XBTZAR": {"timezone": "Africa/Johannesburg"},
-        "XBTEUR": {"timezone": "Europe/London"},
-        "XBTGBP": {"timezone": "Europe/London"},
-    },
+    "pair_specific": PAIR_TIMEZONES,
 }
 
+
 # Performance Tracking Configuration
-PERFORMANCE_CONFIG = {
-    "metrics": [
+class PerformanceReporting(NamedTuple):
+    """Performance report toggles"""
+
+    daily_summary: bool
+    weekly_report: bool
+    monthly_analysis: bool
+    export_to_csv: bool
+    include_charts: bool
+
+
+class PerformanceBenchmarks(NamedTuple):
+    """Benchmarks used for performance comparison"""
+
+    buy_and_hold: bool
+    market_index: str
+    risk_free_rate: float  # Annual risk-free rate
+
+
+class PerformanceSettings(NamedTuple):
+    """Performance tracking configuration"""
+
+    metrics: Tuple[str, ...]
+    reporting: PerformanceReporting
+    benchmarks: PerformanceBenchmarks
+
+
+PERFORMANCE_CONFIG = PerformanceSettings(
+    metrics=(
         "total_return",
         "sharpe_ratio",
         "max_drawdown",
@@ -360,17 +428,32 @@ PERFORMANCE_CONFIG = {
         "profit_factor",
         "total_trades",
         "avg_trade_duration",
-    ],
-    "reporting": {
-        "daily_summary": True,
-        "weekly_report": True,
-        "monthly_analysis": True,
-        "export_to_csv": True,
-        "include_charts": True,
-    },
-    "benchmarks": {
-        "buy_and_hold": True,
-        "market_index": "BTC",
-        "risk_free_rate": 0.03,  # 3% annual risk-free rate
-    },
-}
+    ),
+    reporting=PerformanceReporting(
+        daily_summary=True,
+        weekly_report=True,
+        monthly_analysis=True,
+        export_to_csv=True,
+        include_charts=True,
+    ),
+    benchmarks=PerformanceBenchmarks(
+        buy_and_hold=True,
+        market_index="BTC",
+        risk_free_rate=0.03,  # 3% annual risk-free rate
+    ),
+)
+
+
+def _freeze_lists(
+    table: Mapping[str, Dict[str, Any]], key: str
+) -> Mapping[str, Dict[str, Any]]:
+    """Turn the `key` lists of a config table into frozensets (they are only
+    used for membership tests) and return a read-only view of the table"""
+    for entry in table.values():
+        if key in entry:
+            entry[key] = frozenset(entry[key])
+    return MappingProxyType(table)
+
+
+ENHANCED_TRADING_SIGNALS = _freeze_lists(ENHANCED_TRADING_SIGNALS, "conditions")
+MARKET_REGIMES = _freeze_lists(MARKET_REGIMES, "preferred_signals")
@@ -4,7 +4,47 @@ Luno Trading Bot Configuration
 
 import os
 from dataclasses import dataclass
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Optional, Sequence
+
+from src.config._common import PAIR_TIMEZONES, load_environment, parse_trading_pair
+
+# Read .env before the snapshot below
+load_environment()
+
+# Environment snapshot taken once at import and shared by the field defaults
+_ENV = {
+    key: os.environ.get(key, default)
+    for key, default in (
+        ("LUNO_API_KEY", ""),
+        ("LUNO_API_SECRET", ""),
+        ("TRADING_PAIR", "XBTMYR"),
+        ("DASHBOARD_HOST", "0.0.0.0"),
+        ("DASHBOARD_PORT", "5001"),
+    )
+}
+_DASHBOARD_PORT = int(_ENV["DASHBOARD_PORT"])
+
+
+# Default key price levels per trading pair, shared by every config instance
+_DEFAULT_RESISTANCE_LEVELS = {
+    "XBTMYR": (463000, 465001, 468000, 475001),
+    "XBTZAR": (800000, 820000, 850010, 900000),
+    "XBTEUR": (35001, 36000, 37000, 40000),
+    "XBTGBP": (30000, 31000, 32000, 35001),
+    "ETHXBT": (0.065, 0.070, 0.075, 0.080),
+    "LTCXBT": (0.0025, 0.0030, 0.0035, 0.0040),
+}
+_FALLBACK_RESISTANCE_LEVELS = (50010, 52000, 55001, 60000)
+
+_DEFAULT_SUPPORT_LEVELS = {
+    "XBTMYR": (458000, 455001, 453000, 445001),
+    "XBTZAR": (750010, 730000, 700000, 650010),
+    "XBTEUR": (32000, 31000, 30000, 28000),
+    "XBTGBP": (27000, 26000, 25001, 23000),
+    "ETHXBT": (0.055, 0.050, 0.045, 0.040),
+    "LTCXBT": (0.0020, 0.0018, 0.0015, 0.0012),
+}
+_FALLBACK_SUPPORT_LEVELS = (45001, 42000, 40000, 35001)
 
 
 @dataclass
@@ -12,11 +52,11 @@ class TradingConfig:
     """Luno trading bot configuration settings"""
 
     # Luno API Configuration
-    api_key: str = os.getenv("LUNO_API_KEY", "")
-    api_secret: str = os.getenv("LUNO_API_SECRET", "")
+    api_key: str = _ENV["LUNO_API_KEY"]
+    api_secret: str = _ENV["LUNO_API_SECRET"]
 
     # Trading Parameters
-    trading_pair: str = os.getenv("TRADING_PAIR", "XBTMYR")
+    trading_pair: str = _ENV["TRADING_PAIR"]
     base_currency: str = ""
     counter_currency: str = ""
 
@@ -37,9 +77,9 @@ class TradingConfig:
     bollinger_period: int = 20
     bollinger_std: float = 2.0
 
-    # Key Price Levels (from our analysis)
-    resistance_levels: list = None
-    support_levels: list = None
+    # Key Price Levels (from our analysis); defaults are shared read-only tuples
+    resistance_levels: Optional[Sequence[float]] = None
+    support_levels: Optional[Sequence[float]] = None
 
     # Bot Operation
     check_interval: int = 60  # Check every 60 seconds
@@ -47,16 +87,14 @@ class TradingConfig:
     log_level: str = "INFO"
 
     # Dashboard Configuration
-    dashboard_host: str = os.getenv(
-        "DASHBOARD_HOST", "0.0.0.0"
-    )  # Allow external access by default
-    dashboard_port: int = int(os.getenv("DASHBOARD_PORT", "5001"))
+    dashboard_host: str = _ENV["DASHBOARD_HOST"]  # Allow external access by default
+    dashboard_port: int = _DASHBOARD_PORT
 
     def __post_init__(self):
         """Initialize default values after dataclass creation"""
         # Parse trading pair to extract base and counter currencies
         if self.trading_pair and not self.base_currency:
-            self.base_currency, self.counter_currency = self._parse_trading_pair(
+            self.base_currency, self.counter_currency = parse_trading_pair(
                 self.trading_pair
             )
 
@@ -67,60 +105,15 @@ class TradingConfig:
         if self.support_levels is None:
             self.support_levels = self._get_default_support_levels()
 
-    def _parse_trading_pair(self, pair: str) -> tuple:
-        """Parse trading pair string to extract base and counter currencies"""
-        # Common Luno trading pairs
-        pair_mappings = {
-            "XBTMYR": ("XBT", "MYR"),
-            "XBTZAR": ("XBT", "ZAR"),
-            "XBTEUR": ("XBT", "EUR"),
-            "XBTGBP": ("XBT", "GBP"),
-            "XBTNGN": ("XBT", "NGN"),
-            "XBTUGX": ("XBT", "UGX"),
-            "ETHMYR": ("ETH", "MYR"),
-            "ETHZAR": ("ETH", "ZAR"),
-            "ETHXBT": ("ETH", "XBT"),
-            "LTCMYR": ("LTC", "MYR"),
-            "LTCZAR": ("LTC", "ZAR"),
-            "LTCXBT": ("LTC", "XBT"),
-            "BCHMYR": ("BCH", "MYR"),
-            "BCHZAR": ("BCH", "ZAR"),
-            "BCHXBT": ("BCH", "XBT"),
-        }
-
-        if pair in pair_mappings:
-            return pair_mappings[pair]
-
-        # Fallback: try to parse manually (assumes 3-letter currencies)
-        if len(pair) == 6:
-            return pair[:3], pair[3:]
-
-        # Default fallback
-        return "XBT", "MYR"
-
-    def _get_default_resistance_levels(self) -> list:
+    def _get_default_resistance_levels(self) -> tuple:
         """Get default resistance levels based on trading pair"""
-        defaults = {
-            "XBTMYR": [463000, 465001, 468000, 475001],
-            "XBTZAR": [800000, 820000, 850010, 900000],
-            "XBTEUR": [35001, 36000, 37000, 40000],
-            "XBTGBP": [30000, 31000, 32000, 35001],
-            "ETHXBT": [0.065, 0.070, 0.075, 0.080],
-            "LTCXBT": [0.0025, 0.0030, 0.0035, 0.0040],
-        }
-        return defaults.get(self.trading_pair, [50010, 52000, 55001, 60000])
-
-    def _get_default_support_levels(self) -> list:
+        return _DEFAULT_RESISTANCE_LEVELS.get(
+            self.trading_pair, _FALLBACK_RESISTANCE_LEVELS
+        )
+
+    def _get_default_support_levels(self) -> tuple:
         """Get default support levels based on trading pair"""
-        defaults = {
-            "XBTMYR": [458000, 455001, 453000, 445001],
-            "XBTZAR": [750010, 730000, 700000, 650010],
-            "XBTEUR": [32000, 31000, 30000, 28000],
-            "XBTGBP": [27000, 26000, 25001, 23000],
-            "ETHXBT": [0.055, 0.050, 0.045, 0.040],
-            "LTCXBT": [0.0020, 0.0018, 0.0015, 0.0012],
-        }
-        return defaults.get(self.trading_pair, [45001, 42000, 40000, 35001])
+        return _DEFAULT_SUPPORT_LEVELS.get(self.trading_pair, _FALLBACK_SUPPORT_LEVELS)
 
 
 # Trading Signals Configuration
@@ -175,10 +168,5 @@ TRADING_HOURS = {
     "start": 8,  # 8 AM
     "end": 22,  # 10 PM
     "timezone": "UTC",  # Default timezone, can be overridden per pair
-    "pair_specific": {
-        "XBTMYR": {"timezone": "Asia/Kuala_Lumpur"},
-        "XBTZAR": {"timezone": "Africa/Johannesburg"},
-        "XBTEUR": {"timezone": "Europe/London"},
-        "XBTGBP": {"timezone": "Europe/London"},
-    },
+    "pair_specific": PAIR_TIMEZONES,
 }
@@ -6,18 +6,50 @@ Pre-configured trading strategies and dynamic configuration system
 import logging
 import json
 import os
-from typing import Dict, List, Any, Optional
-from dataclasses import dataclass, asdict
+from collections import defaultdict
+from typing import Callable, Dict, List, Any, Optional, Tuple
+from copy import copy, deepcopy
+from dataclasses import dataclass, asdict, fields
 from datetime import datetime
 from pathlib import Path
 
 from src.config.enhanced_settings import EnhancedTradingConfig
 from src.notifications.notification_manager import NotificationConfig
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 logger = logging.getLogger(__name__)
 
 
-@dataclass
+def _json_loads(data: bytes) -> Any:
+    """Parse JSON bytes, using orjson when it is installed"""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _json_dumps(obj: Any) -> bytes:
+    """Serialize to indented JSON bytes, using orjson when it is installed"""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(obj, default=str, option=orjson.OPT_INDENT_2)
+    return json.dumps(obj, indent=2, default=str).encode()
+
+
+# EnhancedTradingConfig only holds scalar fields, so a shallow read of the
+# field values is equivalent to asdict() without its recursive deepcopy
+_CONFIG_FIELDS = tuple(f.name for f in fields(EnhancedTradingConfig))
+
+
+def _config_to_dict(config: EnhancedTradingConfig) -> Dict[str, Any]:
+    """Shallow field-name -> value mapping of a trading config"""
+    return {name: getattr(config, name) for name in _CONFIG_FIELDS}
+
+
+@dataclass(frozen=True, slots=True)
 class StrategyTemplate:
     """Template for trading strategy configuration"""
     name: str
@@ -36,6 +68,14 @@ class StrategyTemplate:
         data['created_at'] = self.created_at.isoformat()
         return data
     
+    def to_json(self) -> bytes:
+        """Serialize to indented JSON bytes for a template file"""
+        if ORJSON_AVAILABLE:
+            # orjson encodes dataclasses and datetimes natively, so the
+            # intermediate dict from to_dict() is not needed
+            return orjson.dumps(self, option=orjson.OPT_INDENT_2)
+        return _json_dumps(self.to_dict())
+    
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> 'StrategyTemplate':
         """Create from dictionary"""
@@ -43,6 +83,154 @@ class StrategyTemplate:
         return cls(**data)
 
 
+# Creation time reported for the built-in templates; they ship with the code,
+# so a fixed timestamp is used instead of the moment they are first built
+_BUILTIN_CREATED_AT = datetime(2024, 1, 1)
+
+# Built-in strategies, kept as plain specs and only turned into
+# StrategyTemplate instances the first time they are requested
+_DEFAULT_TEMPLATE_SPECS: Tuple[Dict[str, Any], ...] = (
+    # Conservative Strategy
+    {
+        "name": "conservative",
+        "description": "Low-risk strategy focused on capital preservation with steady returns",
+        "risk_level": "conservative",
+        "target_pairs": ["XBTMYR", "ETHMYR"],
+        "config_overrides": {
+            "max_position_size_percent": 1.0,
+            "base_stop_loss_percent": 2.0,
+            "base_take_profit_percent": 4.0,
+            "max_daily_trades": 2,
+            "min_confidence_buy": 0.75,
+            "min_confidence_sell": 0.75,
+            "rsi_oversold": 25,
+            "rsi_overbought": 75,
+            "volatility_position_scaling": True,
+            "min_position_multiplier": 0.5,
+            "max_position_multiplier": 1.0
+        },
+        "performance_targets": {
+            "annual_return": 15.0,
+            "max_drawdown": -10.0,
+            "sharpe_ratio": 1.2,
+            "win_rate": 0.65
+        },
+    },
+
+    # Moderate Strategy
+    {
+        "name": "moderate",
+        "description": "Balanced strategy with moderate risk for steady growth",
+        "risk_level": "moderate",
+        "target_pairs": ["XBTMYR", "XBTZAR", "ETHMYR", "ETHZAR"],
+        "config_overrides": {
+            "max_position_size_percent": 1.5,
+            "base_stop_loss_percent": 3.0,
+            "base_take_profit_percent": 6.0,
+            "max_daily_trades": 3,
+            "min_confidence_buy": 0.65,
+            "min_confidence_sell": 0.65,
+            "rsi_oversold": 30,
+            "rsi_overbought": 70,
+            "volatility_position_scaling": True,
+            "min_position_multiplier": 0.4,
+            "max_position_multiplier": 1.2
+        },
+        "performance_targets": {
+            "annual_return": 25.0,
+            "max_drawdown": -15.0,
+            "sharpe_ratio": 1.0,
+            "win_rate": 0.60
+        },
+    },
+
+    # Aggressive Strategy
+    {
+        "name": "aggressive",
+        "description": "High-risk, high-reward strategy for experienced traders",
+        "risk_level": "aggressive",
+        "target_pairs": ["XBTMYR", "XBTZAR", "XBTEUR", "ETHMYR", "ETHZAR", "LTCMYR"],
+        "config_overrides": {
+            "max_position_size_percent": 2.5,
+            "base_stop_loss_percent": 4.0,
+            "base_take_profit_percent": 8.0,
+            "max_daily_trades": 5,
+            "min_confidence_buy": 0.55,
+            "min_confidence_sell": 0.55,
+            "rsi_oversold": 35,
+            "rsi_overbought": 65,
+            "volatility_position_scaling": True,
+            "min_position_multiplier": 0.3,
+            "max_position_multiplier": 1.5
+        },
+        "performance_targets": {
+            "annual_return": 40.0,
+            "max_drawdown": -25.0,
+            "sharpe_ratio": 0.8,
+            "win_rate": 0.55
+        },
+    },
+
+    # Scalping Strategy
+    {
+        "name": "scalping",
+        "description": "High-frequency trading strategy for quick profits",
+        "risk_level": "aggressive",
+        "target_pairs": ["XBTMYR", "ETHMYR"],
+        "config_overrides": {
+            "max_position_size_percent": 3.0,
+            "base_stop_loss_percent": 1.5,
+            "base_take_profit_percent": 3.0,
+            "max_daily_trades": 10,
+            "min_confidence_buy": 0.50,
+            "min_confidence_sell": 0.50,
+            "check_interval": 30,  # 30 seconds
+            "rsi_period": 7,
+            "ema_short": 5,
+            "ema_medium": 10,
+            "ema_long": 20
+        },
+        "performance_targets": {
+            "annual_return": 50.0,
+            "max_drawdown": -20.0,
+            "sharpe_ratio": 0.9,
+            "win_rate": 0.60
+        },
+    },
+
+    # Swing Trading Strategy
+    {
+        "name": "swing",
+        "description": "Medium-term strategy holding positions for days to weeks",
+        "risk_level": "moderate",
+        "target_pairs": ["XBTMYR", "XBTZAR", "ETHMYR", "ETHZAR"],
+        "config_overrides": {
+            "max_position_size_percent": 2.0,
+            "base_stop_loss_percent": 5.0,
+            "base_take_profit_percent": 10.0,
+            "max_daily_trades": 1,
+            "min_confidence_buy": 0.70,
+            "min_confidence_sell": 0.70,
+            "check_interval": 3600,  # 1 hour
+            "rsi_period": 21,
+            "ema_short": 12,
+            "ema_medium": 26,
+            "ema_long": 50,
+            "bollinger_period": 30
+        },
+        "performance_targets": {
+            "annual_return": 30.0,
+            "max_drawdown": -18.0,
+            "sharpe_ratio": 1.1,
+            "win_rate": 0.58
+        },
+    },
+
+)
+_DEFAULT_TEMPLATE_SPECS_BY_NAME = {spec["name"]: spec for spec in _DEFAULT_TEMPLATE_SPECS}
+_DEFAULT_TEMPLATE_NAMES = frozenset(_DEFAULT_TEMPLATE_SPECS_BY_NAME)
+
+
 class StrategyTemplateManager:
     """Manages strategy templates and configurations"""
     
@@ -51,188 +239,73 @@ class StrategyTemplateManager:
         self.templates_dir.mkdir(parents=True, exist_ok=True)
         
         self.templates: Dict[str, StrategyTemplate] = {}
+        # Template names per risk level, in registration order
+        self._by_risk: Dict[str, List[str]] = defaultdict(list)
+        # Built on first request and dropped whenever the template set changes
+        self._summary_cache: Optional[Dict[str, Dict[str, Any]]] = None
         self._load_default_templates()
         self._load_custom_templates()
         
     def _load_default_templates(self):
-        """Load default strategy templates"""
-        
-        # Conservative Strategy
-        conservative = StrategyTemplate(
-            name="conservative",
-            description="Low-risk strategy focused on capital preservation with steady returns",
-            risk_level="conservative",
-            target_pairs=["XBTMYR", "ETHMYR"],
-            config_overrides={
-                "max_position_size_percent": 1.0,
-                "base_stop_loss_percent": 2.0,
-                "base_take_profit_percent": 4.0,
-                "max_daily_trades": 2,
-                "min_confidence_buy": 0.75,
-                "min_confidence_sell": 0.75,
-                "rsi_oversold": 25,
-                "rsi_overbought": 75,
-                "volatility_position_scaling": True,
-                "min_position_multiplier": 0.5,
-                "max_position_multiplier": 1.0
-            },
-            performance_targets={
-                "annual_return": 15.0,
-                "max_drawdown": -10.0,
-                "sharpe_ratio": 1.2,
-                "win_rate": 0.65
-            },
-            created_at=datetime.now()
-        )
-        
-        # Moderate Strategy
-        moderate = StrategyTemplate(
-            name="moderate",
-            description="Balanced strategy with moderate risk for steady growth",
-            risk_level="moderate",
-            target_pairs=["XBTMYR", "XBTZAR", "ETHMYR", "ETHZAR"],
-            config_overrides={
-                "max_position_size_percent": 1.5,
-                "base_stop_loss_percent": 3.0,
-                "base_take_profit_percent": 6.0,
-                "max_daily_trades": 3,
-                "min_confidence_buy": 0.65,
-                "min_confidence_sell": 0.65,
-                "rsi_oversold": 30,
-                "rsi_overbought": 70,
-                "volatility_position_scaling": True,
-                "min_position_multiplier": 0.4,
-                "max_position_multiplier": 1.2
-            },
-            performance_targets={
-                "annual_return": 25.0,
-                "max_drawdown": -15.0,
-                "sharpe_ratio": 1.0,
-                "win_rate": 0.60
-            },
-            created_at=datetime.now()
-        )
-        
-        # Aggressive Strategy
-        aggressive = StrategyTemplate(
-            name="aggressive",
-            description="High-risk, high-reward strategy for experienced traders",
-            risk_level="aggressive",
-            target_pairs=["XBTMYR", "XBTZAR", "XBTEUR", "ETHMYR", "ETHZAR", "LTCMYR"],
-            config_overrides={
-                "max_position_size_percent": 2.5,
-                "base_stop_loss_percent": 4.0,
-                "base_take_profit_percent": 8.0,
-                "max_daily_trades": 5,
-                "min_confidence_buy": 0.55,
-                "min_confidence_sell": 0.55,
-                "rsi_oversold": 35,
-                "rsi_overbought": 65,
-                "volatility_position_scaling": True,
-                "min_position_multiplier": 0.3,
-                "max_position_multiplier": 1.5
-            },
-            performance_targets={
-                "annual_return": 40.0,
-                "max_drawdown": -25.0,
-                "sharpe_ratio": 0.8,
-                "win_rate": 0.55
-            },
-            created_at=datetime.now()
-        )
-        
-        # Scalping Strategy
-        scalping = StrategyTemplate(
-            name="scalping",
-            description="High-frequency trading strategy for quick profits",
-            risk_level="aggressive",
-            target_pairs=["XBTMYR", "ETHMYR"],
-            config_overrides={
-                "max_position_size_percent": 3.0,
-                "base_stop_loss_percent": 1.5,
-                "base_take_profit_percent": 3.0,
-                "max_daily_trades": 10,
-                "min_confidence_buy": 0.50,
-                "min_confidence_sell": 0.50,
-                "check_interval": 30,  # 30 seconds
-                "rsi_period": 7,
-                "ema_short": 5,
-                "ema_medium": 10,
-                "ema_long": 20
-            },
-            performance_targets={
-                "annual_return": 50.0,
-                "max_drawdown": -20.0,
-                "sharpe_ratio": 0.9,
-                "win_rate": 0.60
-            },
-            created_at=datetime.now()
-        )
-        
-        # Swing Trading Strategy
-        swing = StrategyTemplate(
-            name="swing",
-            description="Medium-term strategy holding positions for days to weeks",
-            risk_level="moderate",
-            target_pairs=["XBTMYR", "XBTZAR", "ETHMYR", "ETHZAR"],
-            config_overrides={
-                "max_position_size_percent": 2.0,
-                "base_stop_loss_percent": 5.0,
-                "base_take_profit_percent": 10.0,
-                "max_daily_trades": 1,
-                "min_confidence_buy": 0.70,
-                "min_confidence_sell": 0.70,
-                "check_interval": 3600,  # 1 hour
-                "rsi_period": 21,
-                "ema_short": 12,
-                "ema_medium": 26,
-                "ema_long": 50,
-                "bollinger_period": 30
-            },
-            performance_targets={
-                "annual_return": 30.0,
-                "max_drawdown": -18.0,
-                "sharpe_ratio": 1.1,
-                "win_rate": 0.58
-            },
-            created_at=datetime.now()
-        )
-        
-        # Store templates
-        self.templates = {
-            "conservative": conservative,
-            "moderate": moderate,
-            "aggressive": aggressive,
-            "scalping": scalping,
-            "swing": swing
-        }
-        
-        logger.info(f"Loaded {len(self.templates)} default strategy templates")
+        """Register default strategy templates (built lazily by get_template)"""
+        self.templates = {}
+        for spec in _DEFAULT_TEMPLATE_SPECS:
+            self._by_risk[spec["risk_level"]].append(spec["name"])
+        logger.info(f"Registered {len(_DEFAULT_TEMPLATE_SPECS)} default strategy templates")
     
     def _load_custom_templates(self):
         """Load custom templates from files"""
         try:
-            for template_file in self.templates_dir.glob("*.json"):
-                with open(template_file, 'r') as f:
-                    data = json.load(f)
+            with os.scandir(self.templates_dir) as entries:
+                for entry in entries:
+                    if not (entry.name.endswith(".json") and entry.is_file()):
+                        continue
+                    with open(entry.path, 'rb') as f:
+                        data = _json_loads(f.read())
                     template = StrategyTemplate.from_dict(data)
-                    self.templates[template.name] = template
+                    self._add_template(template)
                     logger.info(f"Loaded custom template: {template.name}")
         except Exception as e:
             logger.error(f"Error loading custom templates: {e}")
     
+    def _add_template(self, template: StrategyTemplate):
+        """Store a template and index it under its risk level"""
+        self.templates[template.name] = template
+        self._summary_cache = None
+        names = self._by_risk[template.risk_level]
+        if template.name not in names:
+            # A replaced template may have moved to a different risk level
+            self._unindex_template(template.name)
+            names.append(template.name)
+    
+    def _unindex_template(self, name: str):
+        """Drop a template name from the risk level index"""
+        for names in self._by_risk.values():
+            if name in names:
+                names.remove(name)
+    
     def get_template(self, name: str) -> Optional[StrategyTemplate]:
         """Get a strategy template by name"""
-        return self.templates.get(name)
+        template = self.templates.get(name)
+        if template is None:
+            spec = _DEFAULT_TEMPLATE_SPECS_BY_NAME.get(name)
+            if spec is not None:
+                # Copy the spec containers so edits to a template never leak
+                # back into the shared module-level defaults
+                template = StrategyTemplate(
+                    created_at=_BUILTIN_CREATED_AT,
+                    **{key: copy(value) for key, value in spec.items()}
+                )
+                self.templates[name] = template
+        return template
     
     def list_templates(self) -> List[str]:
         """List all available template names"""
-        return list(self.templates.keys())
+        return list(dict.fromkeys([*_DEFAULT_TEMPLATE_SPECS_BY_NAME, *self.templates]))
     
     def get_templates_by_risk_level(self, risk_level: str) -> List[StrategyTemplate]:
         """Get templates filtered by risk level"""
-        return [template for template in self.templates.values() 
-                if template.risk_level == risk_level]
+        return [self.get_template(name) for name in self._by_risk.get(risk_level, ())]
     
     def create_config_from_template(self, 
                                   template_name: str, 
@@ -245,7 +318,7 @@ class StrategyTemplateManager:
             raise ValueError(f"Template '{template_name}' not found")
         
         # Start with base config
-        config_dict = asdict(base_config)
+        config_dict = _config_to_dict(base_config)
         
         # Apply template overrides
         config_dict.update(template.config_overrides)
@@ -265,18 +338,20 @@ class StrategyTemplateManager:
         
         template_file = self.templates_dir / f"{template.name}.json"
         
-        if template_file.exists() and not overwrite:
-            raise ValueError(f"Template '{template.name}' already exists. Use overwrite=True to replace.")
-        
         try:
-            with open(template_file, 'w') as f:
-                json.dump(template.to_dict(), f, indent=2)
+            data = template.to_json()
+            # Exclusive-create mode refuses an existing file, so no separate
+            # exists() check is needed when overwriting is not allowed
+            with open(template_file, 'wb' if overwrite else 'xb') as f:
+                f.write(data)
             
             # Add to memory
-            self.templates[template.name] = template
+            self._add_template(template)
             
             logger.info(f"Saved template: {template.name}")
             
+        except FileExistsError:
+            raise ValueError(f"Template '{template.name}' already exists. Use overwrite=True to replace.") from None
         except Exception as e:
             logger.error(f"Error saving template: {e}")
             raise
@@ -284,24 +359,30 @@ class StrategyTemplateManager:
     def delete_template(self, name: str):
         """Delete a custom template"""
         
-        if name in ["conservative", "moderate", "aggressive", "scalping", "swing"]:
+        if name in _DEFAULT_TEMPLATE_NAMES:
             raise ValueError("Cannot delete default templates")
         
         template_file = self.templates_dir / f"{name}.json"
         
-        if template_file.exists():
-            template_file.unlink()
+        template_file.unlink(missing_ok=True)
         
         if name in self.templates:
             del self.templates[name]
+        self._unindex_template(name)
+        self._summary_cache = None
         
         logger.info(f"Deleted template: {name}")
     
     def get_template_summary(self) -> Dict[str, Dict[str, Any]]:
         """Get summary of all templates"""
         
+        # Callers get their own copy, so changing it can't corrupt the cache
+        if self._summary_cache is not None:
+            return deepcopy(self._summary_cache)
+        
         summary = {}
-        for name, template in self.templates.items():
+        for name in self.list_templates():
+            template = self.get_template(name)
             summary[name] = {
                 "description": template.description,
                 "risk_level": template.risk_level,
@@ -310,7 +391,30 @@ class StrategyTemplateManager:
                 "created_at": template.created_at.isoformat()
             }
         
-        return summary
+        self._summary_cache = summary
+        return deepcopy(summary)
+
+
+# Rules checked by ConfigurationManager.validate_config, in reporting order.
+# Each entry pairs a predicate that passes for a valid config with the issue
+# reported when it fails.
+_CONFIG_RULES: Tuple[Tuple[Callable[[EnhancedTradingConfig], bool], str], ...] = (
+    # Required fields
+    (lambda c: bool(c.api_key), "API key is required"),
+    (lambda c: bool(c.api_secret), "API secret is required"),
+    (lambda c: bool(c.trading_pair), "Trading pair is required"),
+    # Risk management
+    (lambda c: 0 < c.max_position_size_percent <= 10,
+     "Position size should be between 0 and 10%"),
+    (lambda c: 0 < c.base_stop_loss_percent <= 20,
+     "Stop loss should be between 0 and 20%"),
+    (lambda c: c.base_take_profit_percent > c.base_stop_loss_percent,
+     "Take profit should be greater than stop loss"),
+    # Technical parameters
+    (lambda c: 5 <= c.rsi_period <= 50, "RSI period should be between 5 and 50"),
+    (lambda c: c.ema_short < c.ema_medium, "Short EMA should be less than medium EMA"),
+    (lambda c: c.ema_medium < c.ema_long, "Medium EMA should be less than long EMA"),
+)
 
 
 class ConfigurationManager:
@@ -385,9 +489,9 @@ class ConfigurationManager:
         config_file = self.config_dir / f"{name}.json"
         
         try:
-            config_dict = asdict(config)
-            with open(config_file, 'w') as f:
-                json.dump(config_dict, f, indent=2)
+            config_dict = _config_to_dict(config)
+            with open(config_file, 'wb') as f:
+                f.write(_json_dumps(config_dict))
             
             logger.info(f"Saved configuration: {name}")
             
@@ -405,8 +509,8 @@ class ConfigurationManager:
             return None
         
         try:
-            with open(config_file, 'r') as f:
-                config_dict = json.load(f)
+            with open(config_file, 'rb') as f:
+                config_dict = _json_loads(f.read())
             
             config = EnhancedTradingConfig(**config_dict)
             logger.info(f"Loaded configuration: {name}")
@@ -436,34 +540,4 @@ class ConfigurationManager:
     def validate_config(self, config: EnhancedTradingConfig) -> List[str]:
         """Validate configuration and return any issues"""
         
-        issues = []
-        
-        # Check required fields
-        if not config.api_key:
-            issues.append("API key is required")
-        if not config.api_secret:
-            issues.append("API secret is required")
-        if not config.trading_pair:
-            issues.append("Trading pair is required")
-        
-        # Check risk management
-        if config.max_position_size_percent <= 0 or config.max_position_size_percent > 10:
-            issues.append("Position size should be between 0 and 10%")
-        
-        if config.base_stop_loss_percent <= 0 or config.base_stop_loss_percent > 20:
-            issues.append("Stop loss should be between 0 and 20%")
-        
-        if config.base_take_profit_percent <= config.base_stop_loss_percent:
-            issues.append("Take profit should be greater than stop loss")
-        
-        # Check technical parameters
-        if config.rsi_period < 5 or config.rsi_period > 50:
-            issues.append("RSI period should be between 5 and 50")
-        
-        if config.ema_short >= config.ema_medium:
-            issues.append("Short EMA should be less than medium EMA")
-        
-        if config.ema_medium >= config.ema_long:
-            issues.append("Medium EMA should be less than long EMA")
-        
-        return issues
+        return [message for is_valid, message in _CONFIG_RULES if not is_valid(config)]
@@ -6,18 +6,131 @@ import streamlit as st
 import pandas as pd
 import plotly.graph_objects as go
 import plotly.express as px
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
+import heapq
 import json
 import os
 import requests
-import time
+from requests.adapters import HTTPAdapter
 import logging
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
+
+try:
+    import orjson
+
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Directory the enhanced bot writes its reports to
+REPORTS_DIR = "enhanced_reports"
+
+# Number of most recent report files shown on the dashboard
+MAX_REPORTS = 10
+
+# Number of most recent reports whose trades are listed on the dashboard
+TRADE_HISTORY_REPORTS = 3
+
+# Trade fields shown in the recent trades table
+TRADE_COLUMNS = ("timestamp", "action", "price", "volume", "confidence", "strength")
+
+# Report sections the dashboard renders; everything else is dropped before
+# the reports are cached, so each rerun copies less data out of the cache
+REPORT_FIELDS = ("generated_at", "performance_metrics")
+
+# Interval between automatic dashboard refreshes
+AUTO_REFRESH_SECONDS = 30
+
+
+def _read_report(path: str) -> Dict:
+    """Read and parse a single JSON report file"""
+    with open(path, "rb") as f:
+        data = f.read()
+    if ORJSON_AVAILABLE:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _project_report(report: Dict, keep_trades: bool) -> Dict:
+    """Keep only the report sections the dashboard renders"""
+    projected = {key: report[key] for key in REPORT_FIELDS if key in report}
+    if keep_trades and "trades_history" in report:
+        projected["trades_history"] = report["trades_history"]
+    return projected
+
+
+# Shared session so reruns reuse the keep-alive connection to the bot
+_session = requests.Session()
+_session.mount("http://", HTTPAdapter(pool_connections=2, pool_maxsize=4))
+
+
+# Streamlit reruns the whole script on every widget interaction, so bot
+# requests and report reads are cached for a few seconds. Caching happens at
+# module level because st.cache_data keys on the function and its arguments.
+def _get_bot_health(url: str) -> Dict:
+    """Check if the enhanced trading bot is running"""
+    try:
+        response = _session.get(url, timeout=5)
+        if response.status_code == 200:
+            return {"status": "healthy", "data": response.json()}
+        else:
+            return {"status": "unhealthy", "error": f"HTTP {response.status_code}"}
+    except requests.exceptions.RequestException as e:
+        return {"status": "offline", "error": str(e)}
+
+
+def _get_bot_status(url: str) -> Dict:
+    """Get detailed bot status"""
+    try:
+        response = _session.get(url, timeout=5)
+        if response.status_code == 200:
+            return {"success": True, "data": response.json()}
+        else:
+            return {"success": False, "error": f"HTTP {response.status_code}"}
+    except requests.exceptions.RequestException as e:
+        return {"success": False, "error": str(e)}
+
+
+@st.cache_data(ttl=5, show_spinner=False)
+def fetch_bot_state(health_url: str, status_url: str) -> Tuple[Dict, Dict]:
+    """Fetch bot health and status, querying both endpoints concurrently"""
+    # The workers only make HTTP requests; Streamlit calls (including the
+    # cache) must stay on the script thread, which has the ScriptRunContext
+    with ThreadPoolExecutor(max_workers=2) as pool:
+        health_future = pool.submit(_get_bot_health, health_url)
+        status_future = pool.submit(_get_bot_status, status_url)
+        return health_future.result(), status_future.result()
+
+
+@st.cache_data(ttl=10, show_spinner=False)
+def load_recent_reports(reports_dir: str) -> List[Dict]:
+    """Load the most recent trading reports, newest first"""
+    reports = []
+
+    if os.path.exists(reports_dir):
+        try:
+            with os.scandir(reports_dir) as entries:
+                report_files = [
+                    entry.path for entry in entries if entry.name.endswith(".json")
+                ]
+            # Report names are timestamped, so the largest names are newest
+            latest = heapq.nlargest(MAX_REPORTS, report_files)
+            with ThreadPoolExecutor(max_workers=4) as pool:
+                reports = [
+                    _project_report(report, index < TRADE_HISTORY_REPORTS)
+                    for index, report in enumerate(pool.map(_read_report, latest))
+                ]
+        except Exception as e:
+            logger.error(f"Error loading reports: {e}")
+
+    return reports
+
+
 # Page configuration
 st.set_page_config(
     page_title="Enhanced Trading Bot Dashboard",
@@ -78,45 +191,13 @@ class EnhancedDashboard:
         self.bot_health_url = f"http://{bot_host}:{bot_port}/health"
         self.bot_status_url = f"http://{bot_host}:{bot_port}/status"
 
-    def check_bot_health(self) -> Dict:
-        """Check if the enhanced trading bot is running"""
-        try:
-            response = requests.get(self.bot_health_url, timeout=5)
-            if response.status_code == 200:
-                return {"status": "healthy", "data": response.json()}
-            else:
-                return {"status": "unhealthy", "error": f"HTTP {response.status_code}"}
-        except requests.exceptions.RequestException as e:
-            return {"status": "offline", "error": str(e)}
-
-    def get_bot_status(self) -> Dict:
-        """Get detailed bot status"""
-        try:
-            response = requests.get(self.bot_status_url, timeout=5)
-            if response.status_code == 200:
-                return {"success": True, "data": response.json()}
-            else:
-                return {"success": False, "error": f"HTTP {response.status_code}"}
-        except requests.exceptions.RequestException as e:
-            return {"success": False, "error": str(e)}
+    def get_bot_state(self) -> Tuple[Dict, Dict]:
+        """Get bot health and detailed status"""
+        return fetch_bot_state(self.bot_health_url, self.bot_status_url)
 
     def load_trading_reports(self) -> List[Dict]:
         """Load recent trading reports"""
-        reports = []
-        reports_dir = "enhanced_reports"
-
-        if os.path.exists(reports_dir):
-            try:
-                for filename in sorted(os.listdir(reports_dir), reverse=True)[:10]:
-                    if filename.endswith(".json"):
-                        filepath = os.path.join(reports_dir, filename)
-                        with open(filepath, "r") as f:
-                            report = json.load(f)
-                            reports.append(report)
-            except Exception as e:
-                logger.error(f"Error loading reports: {e}")
-
-        return reports
+        return load_recent_reports(REPORTS_DIR)
 
     def render_header(self):
         """Render dashboard header"""
@@ -134,8 +215,7 @@ class EnhancedDashboard:
         """Render bot status section"""
         st.subheader("🤖 Bot Status")
 
-        health = self.check_bot_health()
-        status_data = self.get_bot_status()
+        health, status_data = self.get_bot_state()
 
         col1, col2, col3 = st.columns(3)
 
@@ -177,12 +257,10 @@ class EnhancedDashboard:
                 f"Failed to get bot status: {status_data.get('error', 'Unknown error')}"
             )
 
-    def render_performance_metrics(self):
+    def render_performance_metrics(self, reports: List[Dict]):
         """Render performance metrics"""
         st.subheader("📊 Performance Metrics")
 
-        reports = self.load_trading_reports()
-
         if not reports:
             st.warning(
                 "No trading reports found. The bot may not have generated any reports yet."
@@ -210,68 +288,62 @@ class EnhancedDashboard:
             profit_factor = metrics.get("profit_factor", 0)
             st.metric("Profit Factor", f"{profit_factor:.2f}")
 
-    def render_recent_trades(self):
+    def render_recent_trades(self, reports: List[Dict]):
         """Render recent trades"""
         st.subheader("💼 Recent Trades")
 
-        reports = self.load_trading_reports()
-
         if not reports:
             st.info("No trades data available")
             return
 
-        # Combine trades from recent reports
-        all_trades = []
-        for report in reports[:3]:  # Last 3 reports
-            trades = report.get("trades_history", [])
-            all_trades.extend(trades)
+        # Combine trades from recent reports, keeping only the shown columns
+        trade_rows = [
+            tuple(trade.get(column) for column in TRADE_COLUMNS)
+            for report in reports[:TRADE_HISTORY_REPORTS]
+            for trade in report.get("trades_history", [])
+        ]
 
-        if not all_trades:
+        if not trade_rows:
             st.info("No trades executed yet")
             return
 
         # Convert to DataFrame
-        df = pd.DataFrame(all_trades)
+        df = pd.DataFrame.from_records(trade_rows, columns=TRADE_COLUMNS)
 
         # Sort by timestamp
-        if "timestamp" in df.columns:
-            df["timestamp"] = pd.to_datetime(df["timestamp"])
-            df = df.sort_values("timestamp", ascending=False)
+        df["timestamp"] = pd.to_datetime(df["timestamp"])
+        df = df.sort_values("timestamp", ascending=False)
 
         # Display recent trades
-        st.dataframe(
-            df[
-                ["timestamp", "action", "price", "volume", "confidence", "strength"]
-            ].head(10),
-            use_container_width=True,
-        )
+        st.dataframe(df.head(10), use_container_width=True)
 
-    def render_charts(self):
+    def render_charts(self, reports: List[Dict]):
         """Render trading charts"""
         st.subheader("📈 Trading Analysis")
 
-        reports = self.load_trading_reports()
-
         if not reports:
             st.info("No data available for charts")
             return
 
         # Performance over time chart
         if len(reports) > 1:
-            performance_data = []
+            # Build the columns directly rather than a dict per report
+            dates, total_returns, win_rates, total_trades = [], [], [], []
             for report in reversed(reports):
                 metrics = report.get("performance_metrics", {})
-                performance_data.append(
-                    {
-                        "date": report.get("generated_at", ""),
-                        "total_return": metrics.get("total_return", 0),
-                        "win_rate": metrics.get("win_rate", 0),
-                        "total_trades": metrics.get("total_trades", 0),
-                    }
-                )
-
-            df_perf = pd.DataFrame(performance_data)
-            df_perf["date"] = pd.to_datetime(df_perf["date"])
+                dates.append(report.get("generated_at", ""))
+                total_returns.append(metrics.get("total_return", 0))
+                win_rates.append(metrics.get("win_rate", 0))
+                total_trades.append(metrics.get("total_trades", 0))
+
+            df_perf = pd.DataFrame(
+                {
+                    "date": pd.to_datetime(dates),
+                    "total_return": total_returns,
+                    "win_rate": win_rates,
+                    "total_trades": total_trades,
+                }
+            )
 
             # Total return chart
             fig_return = px.line(
@@ -303,19 +375,31 @@ def main():
 
     # Auto-refresh
     if st.sidebar.button("🔄 Refresh"):
+        st.cache_data.clear()
         st.rerun()
 
     # Auto-refresh toggle
-    auto_refresh = st.sidebar.checkbox("Auto Refresh (30s)", value=False)
+    auto_refresh = st.sidebar.checkbox(
+        f"Auto Refresh ({AUTO_REFRESH_SECONDS}s)", value=False
+    )
+
+    # Main content. Auto refresh reruns this fragment on a client-driven
+    # timer, so the script returns right away instead of sleeping on a
+    # server thread between refreshes.
+    @st.fragment(run_every=AUTO_REFRESH_SECONDS if auto_refresh else None)
+    def render_content():
+        # Load the reports once and share them between the sections below
+        reports = dashboard.load_trading_reports()
+
+        dashboard.render_bot_status()
+        st.divider()
+        dashboard.render_performance_metrics(reports)
+        st.divider()
+        dashboard.render_recent_trades(reports)
+        st.divider()
+        dashboard.render_charts(reports)
 
-    # Main content
-    dashboard.render_bot_status()
-    st.divider()
-    dashboard.render_performance_metrics()
-    st.divider()
-    dashboard.render_recent_trades()
-    st.divider()
-    dashboard.render_charts()
+    render_content()
 
     # Sidebar info
     st.sidebar.markdown("### 📋 Dashboard Info")
@@ -361,11 +445,6 @@ def main():
     bot_health_url = f"http://{os.getenv('BOT_HOST', 'localhost')}:{os.getenv('BOT_PORT', '5002')}/health"
     st.sidebar.code(bot_health_url)
 
-    # Auto-refresh logic
-    if auto_refresh:
-        time.sleep(30)
-        st.rerun()
-
 
 if __name__ == "__main__":
     main()
@@ -2,9 +2,8 @@
 Simple health check server for the dashboard
 """
 
-import json
 import threading
-from http.server import HTTPServer, BaseHTTPRequestHandler
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
 from datetime import datetime
 import logging
 
@@ -14,6 +13,16 @@ logger = logging.getLogger(__name__)
 class DashboardHealthHandler(BaseHTTPRequestHandler):
     """Health check handler for dashboard"""
 
+    # Buffer the response stream so the headers and body go out in a single
+    # send() when the handler finishes, instead of one write per call
+    wbufsize = -1
+
+    # Encoded health payload; only the timestamp changes between requests
+    HEALTH_RESPONSE_TEMPLATE = (
+        b'{"status": "healthy", "timestamp": "%b", '
+        b'"service": "enhanced-dashboard", "version": "1.0"}'
+    )
+
     def do_GET(self):
         """Handle GET requests"""
         if self.path == "/health":
@@ -25,18 +34,14 @@ class DashboardHealthHandler(BaseHTTPRequestHandler):
     def send_health_response(self):
         """Send health check response"""
         try:
-            health_data = {
-                "status": "healthy",
-                "timestamp": datetime.now().isoformat(),
-                "service": "enhanced-dashboard",
-                "version": "1.0",
-            }
+            body = self.HEALTH_RESPONSE_TEMPLATE % datetime.now().isoformat().encode()
 
             self.send_response(200)
             self.send_header("Content-type", "application/json")
+            self.send_header("Content-Length", str(len(body)))
             self.send_header("Access-Control-Allow-Origin", "*")
             self.end_headers()
-            self.wfile.write(json.dumps(health_data).encode())
+            self.wfile.write(body)
 
         except Exception as e:
             logger.error(f"Health check error: {e}")
@@ -60,7 +65,12 @@ class DashboardHealthServer:
     def start(self):
         """Start the health check server"""
         try:
-            self.server = HTTPServer(("0.0.0.0", self.port), DashboardHealthHandler)
+            # Each probe gets its own thread so a slow client cannot hold up
+            # the others; request threads never block interpreter shutdown
+            self.server = ThreadingHTTPServer(
+                ("0.0.0.0", self.port), DashboardHealthHandler
+            )
+            self.server.daemon_threads = True
             self.thread = threading.Thread(
                 target=self.server.serve_forever, daemon=True
             )
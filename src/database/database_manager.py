@@ -4,11 +4,15 @@ Comprehensive database management for historical data storage and retrieval
 """
 
 import logging
+import queue
 import sqlite3
+import threading
+import time
 import pandas as pd
 import json
-from typing import Dict, List, Optional, Any, Tuple
-from datetime import datetime, timedelta
+from typing import Dict, Iterator, List, Optional, Any, Sequence, Tuple
+from contextlib import contextmanager
+from datetime import datetime, timedelta, timezone
 from dataclasses import dataclass, asdict
 from pathlib import Path
 import os
@@ -21,10 +25,189 @@ try:
 except ImportError:
     SQLALCHEMY_AVAILABLE = False
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+try:
+    import pyarrow  # noqa: F401
+    PYARROW_AVAILABLE = True
+except ImportError:
+    PYARROW_AVAILABLE = False
+
 logger = logging.getLogger(__name__)
 
 Base = declarative_base() if SQLALCHEMY_AVAILABLE else None
 
+# Market data columns are loaded into Arrow-backed arrays when pyarrow is
+# installed, avoiding boxed Python objects for large OHLCV ranges
+MARKET_DATA_READ_OPTIONS: Dict[str, Any] = (
+    {"dtype_backend": "pyarrow"} if PYARROW_AVAILABLE else {}
+)
+
+# Rows per DataFrame yielded by DatabaseManager.iter_market_data/iter_trades;
+# each chunk is read as its own keyset-paged query
+MARKET_DATA_CHUNK_SIZE = 50_000
+TRADES_CHUNK_SIZE = 10_000
+
+# Columns of the trades table that get_trades can select
+TRADE_COLUMNS = frozenset({
+    'id', 'trade_id', 'timestamp', 'pair', 'action', 'volume', 'price',
+    'commission', 'pnl', 'strategy', 'confidence', 'metadata', 'created_at',
+})
+
+_SQL_UPSERT_MARKET_DATA = """
+    INSERT INTO market_data 
+    (timestamp, pair, open_price, high_price, low_price, close_price, volume, timeframe)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+    ON CONFLICT(timestamp, pair, timeframe) DO UPDATE SET
+        open_price = excluded.open_price,
+        high_price = excluded.high_price,
+        low_price = excluded.low_price,
+        close_price = excluded.close_price,
+        volume = excluded.volume
+"""
+
+_SQL_UPSERT_TRADE = """
+    INSERT INTO trades 
+    (trade_id, timestamp, pair, action, volume, price, commission, pnl, strategy, confidence, metadata)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+    ON CONFLICT(trade_id) DO UPDATE SET
+        timestamp = excluded.timestamp,
+        pair = excluded.pair,
+        action = excluded.action,
+        volume = excluded.volume,
+        price = excluded.price,
+        commission = excluded.commission,
+        pnl = excluded.pnl,
+        strategy = excluded.strategy,
+        confidence = excluded.confidence,
+        metadata = excluded.metadata
+"""
+
+_SQL_INSERT_PERFORMANCE = """
+    INSERT INTO performance 
+    (timestamp, portfolio_value, total_pnl, daily_pnl, drawdown, sharpe_ratio, win_rate, total_trades, metadata)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+    RETURNING *
+"""
+
+_SQL_INSERT_SIGNAL = """
+    INSERT INTO signals 
+    (timestamp, pair, signal_type, action, confidence, price, indicators)
+    VALUES (?, ?, ?, ?, ?, ?, ?)
+"""
+
+_SQL_SELECT_MARKET_DATA = """
+    SELECT timestamp, open_price, high_price, low_price, close_price, volume
+    FROM market_data 
+    WHERE pair = ? AND timeframe = ? AND timestamp BETWEEN ? AND ?
+    ORDER BY timestamp
+"""
+
+# One page of iter_market_data; timestamps are unique per pair and timeframe,
+# so the last one read is the key the next page starts after
+_SQL_PAGE_MARKET_DATA = """
+    SELECT timestamp AS page_key, timestamp, open_price, high_price, low_price,
+           close_price, volume
+    FROM market_data 
+    WHERE pair = ? AND timeframe = ? AND timestamp > ? AND timestamp <= ?
+    ORDER BY timestamp
+    LIMIT ?
+"""
+
+# Win/loss aggregates for calculate_trade_statistics, computed in one pass so
+# only a single row comes back regardless of how many trades match
+_SQL_TRADE_STATISTICS = """
+    SELECT COUNT(*) AS total_trades,
+           COUNT(CASE WHEN pnl > 0 THEN 1 END) AS winning_trades,
+           COUNT(CASE WHEN pnl < 0 THEN 1 END) AS losing_trades,
+           TOTAL(pnl) AS total_pnl,
+           TOTAL(CASE WHEN pnl > 0 THEN pnl END) AS gross_profit,
+           TOTAL(CASE WHEN pnl < 0 THEN pnl END) AS gross_loss
+    FROM trades
+    WHERE timestamp >= ?
+"""
+
+# Free pages returned to the filesystem per cleanup_old_data call
+INCREMENTAL_VACUUM_PAGES = 1000
+
+# Pages copied per backup step; the source is only locked while a step runs
+BACKUP_PAGES_PER_STEP = 1024
+
+# Event timestamps are stored as integer microseconds since the Unix epoch, so
+# range filters compare integers and reads convert whole columns at once
+_EPOCH = datetime(1970, 1, 1)
+_MICROSECOND = timedelta(microseconds=1)
+EPOCH_US_PARSE = {'unit': 'us'}
+
+# Bumped with PRAGMA user_version once text timestamps have been converted
+SCHEMA_VERSION = 1
+
+# Seconds a calculate_trade_statistics result is reused for the same arguments
+TRADE_STATS_CACHE_TTL = 5.0
+
+# Prepared statements kept per connection; the hot DML above is reused as the
+# same module-level strings, so it stays in the cache across calls
+SQLITE_CACHED_STATEMENTS = 256
+
+# Most read-only connections kept open on a file database; further concurrent
+# readers wait for one to be returned
+SQLITE_READER_POOL_SIZE = 4
+
+# Seconds a read waits for a pooled connection before giving up
+SQLITE_READER_TIMEOUT = 30.0
+
+def _dump_json(value: Any) -> str:
+    """Encode a JSON column value in compact form"""
+    if ORJSON_AVAILABLE:
+        # Indicator values are often numpy scalars, and the stdlib encoder
+        # accepts non-string keys, so enable both in orjson
+        return orjson.dumps(
+            value, option=orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+        ).decode()
+    return json.dumps(value, separators=(',', ':'))
+
+
+def _to_epoch_us(value: datetime) -> int:
+    """Convert a datetime to integer microseconds since the epoch.
+    
+    Naive values are stored as-is, matching how they read back; aware values
+    are normalised to UTC first.
+    """
+    if value.tzinfo is not None:
+        value = value.astimezone(timezone.utc).replace(tzinfo=None)
+    return (value - _EPOCH) // _MICROSECOND
+
+
+def _from_epoch_us(value: int) -> datetime:
+    """Convert stored epoch microseconds back to a naive datetime"""
+    return _EPOCH + timedelta(microseconds=value)
+
+
+def _load_json(value: Optional[str]) -> Any:
+    """Decode a JSON column value, mapping empty values to an empty dict"""
+    if not value:
+        return {}
+    if ORJSON_AVAILABLE:
+        return orjson.loads(value)
+    return json.loads(value)
+
+
+# Per-connection SQLite tuning: relaxed fsync (safe under WAL), in-memory temp
+# tables, a 64MB page cache, 256MB of memory-mapped I/O and a busy timeout so
+# concurrent writers wait instead of failing with "database is locked"
+SQLITE_PRAGMAS = (
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA cache_size=-65536",
+    "PRAGMA mmap_size=268435456",
+    "PRAGMA busy_timeout=5000",
+    "PRAGMA foreign_keys=ON",
+)
+
 
 @dataclass
 class MarketDataRecord:
@@ -75,6 +258,12 @@ class DatabaseManager:
     def __init__(self, db_path: str = "data/trading_bot.db", use_sqlite: bool = True):
         self.db_path = db_path
         self.use_sqlite = use_sqlite
+        # Number of holders sharing this manager; see get_database_manager
+        self._users = 1
+        # (pair, days) -> (monotonic time computed, statistics)
+        self._stats_cache: Dict[Tuple[Optional[str], int], Tuple[float, Dict[str, Any]]] = {}
+        # Newest performance row, once known; kept current by store_performance
+        self._latest_performance: Optional[Dict[str, Any]] = None
         
         # Ensure data directory exists
         Path(db_path).parent.mkdir(parents=True, exist_ok=True)
@@ -88,12 +277,104 @@ class DatabaseManager:
             self._init_sqlite()
     
     def _init_sqlite(self):
-        """Initialize SQLite database"""
-        self.connection = sqlite3.connect(self.db_path, check_same_thread=False)
+        """Initialize SQLite database (no-op if it is already open)"""
+        if getattr(self, 'connection', None) is not None:
+            return
+        
+        # Single writer connection in autocommit mode; write transactions are
+        # opened explicitly by _write_transaction
+        self.connection = sqlite3.connect(
+            self.db_path, check_same_thread=False, isolation_level=None,
+            cached_statements=SQLITE_CACHED_STATEMENTS
+        )
         self.connection.row_factory = sqlite3.Row
+        # Let cleanup hand freed pages back without a full VACUUM; this only
+        # takes effect on a new database (older ones convert on first cleanup),
+        # so it must precede the journal mode switch that initialises the file
+        self.connection.execute("PRAGMA auto_vacuum=INCREMENTAL")
+        self._configure_sqlite_connection(self.connection)
+        self._write_lock = threading.RLock()
         self._create_sqlite_tables()
+        
+        # Read-only connections are opened lazily into a small bounded pool,
+        # so reads never wait on the writer and short-lived threads don't each
+        # keep a connection (and its page cache) open. An in-memory database
+        # is private to its connection, so reads there go through the writer.
+        self._read_uri: Optional[str] = None
+        if self.db_path != ":memory:":
+            self._read_uri = f"{Path(self.db_path).resolve().as_uri()}?mode=ro"
+        # LIFO hands out the most recently used connection, whose cache is warm
+        self._reader_pool: "queue.LifoQueue[sqlite3.Connection]" = queue.LifoQueue()
+        self._readers: List[sqlite3.Connection] = []
+        
         logger.info(f"SQLite database initialized: {self.db_path}")
     
+    def _configure_sqlite_connection(self, connection: sqlite3.Connection,
+                                     read_only: bool = False):
+        """Apply journal mode and tuning PRAGMAs to a SQLite connection"""
+        if read_only:
+            connection.execute("PRAGMA query_only=1")
+        elif self.db_path != ":memory:":
+            # WAL lets readers proceed while a write is in progress; it is
+            # persistent in the database file and unsupported in memory
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute("PRAGMA wal_autocheckpoint=1000")
+        for pragma in SQLITE_PRAGMAS:
+            connection.execute(pragma)
+    
+    @contextmanager
+    def _write_transaction(self) -> Iterator[sqlite3.Connection]:
+        """Run a block in an immediate write transaction on the writer"""
+        with self._write_lock:
+            # BEGIN IMMEDIATE takes the write lock up front, so the
+            # transaction never fails later upgrading from a read lock
+            self.connection.execute("BEGIN IMMEDIATE")
+            try:
+                yield self.connection
+            except BaseException:
+                self.connection.execute("ROLLBACK")
+                raise
+            self.connection.execute("COMMIT")
+    
+    @contextmanager
+    def _reader(self) -> Iterator[sqlite3.Connection]:
+        """Yield a read-only connection borrowed from the reader pool"""
+        if self._read_uri is None:
+            with self._write_lock:
+                yield self.connection
+            return
+        
+        try:
+            connection = self._reader_pool.get_nowait()
+        except queue.Empty:
+            connection = None
+            with self._write_lock:
+                if len(self._readers) < SQLITE_READER_POOL_SIZE:
+                    connection = self._open_reader()
+                    self._readers.append(connection)
+            if connection is None:
+                try:
+                    connection = self._reader_pool.get(timeout=SQLITE_READER_TIMEOUT)
+                except queue.Empty:
+                    raise TimeoutError(
+                        f"No SQLite reader became free within {SQLITE_READER_TIMEOUT}s"
+                    ) from None
+        try:
+            yield connection
+        finally:
+            self._reader_pool.put(connection)
+    
+    def _open_reader(self) -> sqlite3.Connection:
+        """Open a read-only connection for the reader pool"""
+        # Pooled connections move between threads
+        connection = sqlite3.connect(
+            self._read_uri, uri=True, check_same_thread=False,
+            cached_statements=SQLITE_CACHED_STATEMENTS
+        )
+        connection.row_factory = sqlite3.Row
+        self._configure_sqlite_connection(connection, read_only=True)
+        return connection
+    
     def _init_sqlalchemy(self):
         """Initialize SQLAlchemy database"""
         # For now, use SQLite with SQLAlchemy
@@ -107,13 +388,20 @@ class DatabaseManager:
     
     def _create_sqlite_tables(self):
         """Create SQLite tables"""
-        cursor = self.connection.cursor()
+        with self._write_transaction() as connection:
+            self._create_sqlite_schema(connection)
+        # Refresh planner statistics where they are missing or stale
+        self.connection.execute("PRAGMA optimize")
+        logger.info("SQLite tables created successfully")
+    
+    def _create_sqlite_schema(self, connection: sqlite3.Connection):
+        """Create tables and indexes on the given connection"""
         
         # Market data table
-        cursor.execute("""
+        connection.execute("""
             CREATE TABLE IF NOT EXISTS market_data (
                 id INTEGER PRIMARY KEY AUTOINCREMENT,
-                timestamp DATETIME NOT NULL,
+                timestamp INTEGER NOT NULL,
                 pair TEXT NOT NULL,
                 open_price REAL NOT NULL,
                 high_price REAL NOT NULL,
@@ -127,11 +415,11 @@ class DatabaseManager:
         """)
         
         # Trades table
-        cursor.execute("""
+        connection.execute("""
             CREATE TABLE IF NOT EXISTS trades (
                 id INTEGER PRIMARY KEY AUTOINCREMENT,
                 trade_id TEXT UNIQUE NOT NULL,
-                timestamp DATETIME NOT NULL,
+                timestamp INTEGER NOT NULL,
                 pair TEXT NOT NULL,
                 action TEXT NOT NULL,
                 volume REAL NOT NULL,
@@ -146,10 +434,10 @@ class DatabaseManager:
         """)
         
         # Performance table
-        cursor.execute("""
+        connection.execute("""
             CREATE TABLE IF NOT EXISTS performance (
                 id INTEGER PRIMARY KEY AUTOINCREMENT,
-                timestamp DATETIME NOT NULL,
+                timestamp INTEGER NOT NULL,
                 portfolio_value REAL NOT NULL,
                 total_pnl REAL DEFAULT 0,
                 daily_pnl REAL DEFAULT 0,
@@ -163,10 +451,10 @@ class DatabaseManager:
         """)
         
         # Signals table
-        cursor.execute("""
+        connection.execute("""
             CREATE TABLE IF NOT EXISTS signals (
                 id INTEGER PRIMARY KEY AUTOINCREMENT,
-                timestamp DATETIME NOT NULL,
+                timestamp INTEGER NOT NULL,
                 pair TEXT NOT NULL,
                 signal_type TEXT NOT NULL,
                 action TEXT NOT NULL,
@@ -178,10 +466,10 @@ class DatabaseManager:
         """)
         
         # Portfolio allocations table
-        cursor.execute("""
+        connection.execute("""
             CREATE TABLE IF NOT EXISTS portfolio_allocations (
                 id INTEGER PRIMARY KEY AUTOINCREMENT,
-                timestamp DATETIME NOT NULL,
+                timestamp INTEGER NOT NULL,
                 pair TEXT NOT NULL,
                 target_weight REAL NOT NULL,
                 current_weight REAL NOT NULL,
@@ -192,29 +480,42 @@ class DatabaseManager:
             )
         """)
         
+        # Convert timestamps written as ISO text by older versions
+        if connection.execute("PRAGMA user_version").fetchone()[0] < SCHEMA_VERSION:
+            for table in ('market_data', 'trades', 'performance', 'signals',
+                          'portfolio_allocations'):
+                connection.execute(f"""
+                    UPDATE {table}
+                    SET timestamp = CAST(strftime('%s', timestamp) AS INTEGER) * 1000000
+                        + CASE WHEN instr(timestamp, '.') > 0 THEN CAST(substr(
+                            substr(timestamp, instr(timestamp, '.') + 1) || '000000', 1, 6
+                        ) AS INTEGER) ELSE 0 END
+                    WHERE typeof(timestamp) = 'text'
+                """)
+            connection.execute(f"PRAGMA user_version={SCHEMA_VERSION}")
+        
         # Create indexes for better performance
-        cursor.execute("CREATE INDEX IF NOT EXISTS idx_market_data_timestamp ON market_data(timestamp)")
-        cursor.execute("CREATE INDEX IF NOT EXISTS idx_market_data_pair ON market_data(pair)")
-        cursor.execute("CREATE INDEX IF NOT EXISTS idx_trades_timestamp ON trades(timestamp)")
-        cursor.execute("CREATE INDEX IF NOT EXISTS idx_trades_pair ON trades(pair)")
-        cursor.execute("CREATE INDEX IF NOT EXISTS idx_performance_timestamp ON performance(timestamp)")
-        cursor.execute("CREATE INDEX IF NOT EXISTS idx_signals_timestamp ON signals(timestamp)")
-        
-        self.connection.commit()
-        logger.info("SQLite tables created successfully")
+        connection.execute("CREATE INDEX IF NOT EXISTS idx_market_data_timestamp ON market_data(timestamp)")
+        connection.execute("CREATE INDEX IF NOT EXISTS idx_trades_timestamp ON trades(timestamp)")
+        
+        # Composite indexes matching the pair/timeframe/time-range queries;
+        # they make the old single-column pair indexes redundant
+        connection.execute("CREATE INDEX IF NOT EXISTS idx_market_data_pair_tf_ts ON market_data(pair, timeframe, timestamp)")
+        connection.execute("CREATE INDEX IF NOT EXISTS idx_trades_pair_ts ON trades(pair, timestamp)")
+        connection.execute("DROP INDEX IF EXISTS idx_market_data_pair")
+        connection.execute("DROP INDEX IF EXISTS idx_trades_pair")
+        # Partial indexes covering only winning / losing trades
+        connection.execute("CREATE INDEX IF NOT EXISTS idx_trades_wins ON trades(pnl) WHERE pnl > 0")
+        connection.execute("CREATE INDEX IF NOT EXISTS idx_trades_losses ON trades(pnl) WHERE pnl < 0")
+        connection.execute("CREATE INDEX IF NOT EXISTS idx_performance_timestamp ON performance(timestamp)")
+        connection.execute("CREATE INDEX IF NOT EXISTS idx_signals_timestamp ON signals(timestamp)")
     
     def store_market_data(self, data: List[MarketDataRecord]) -> bool:
         """Store market data records"""
         try:
-            cursor = self.connection.cursor()
-            
-            for record in data:
-                cursor.execute("""
-                    INSERT OR REPLACE INTO market_data 
-                    (timestamp, pair, open_price, high_price, low_price, close_price, volume, timeframe)
-                    VALUES (?, ?, ?, ?, ?, ?, ?, ?)
-                """, (
-                    record.timestamp,
+            rows = [
+                (
+                    _to_epoch_us(record.timestamp),
                     record.pair,
                     record.open_price,
                     record.high_price,
@@ -222,9 +523,14 @@ class DatabaseManager:
                     record.close_price,
                     record.volume,
                     record.timeframe
-                ))
+                )
+                for record in data
+            ]
+            
+            # One executemany in a single transaction; rolled back on error
+            with self._write_transaction() as connection:
+                connection.executemany(_SQL_UPSERT_MARKET_DATA, rows)
             
-            self.connection.commit()
             logger.debug(f"Stored {len(data)} market data records")
             return True
             
@@ -235,29 +541,23 @@ class DatabaseManager:
     def store_trade(self, trade: TradeRecord) -> bool:
         """Store a trade record"""
         try:
-            cursor = self.connection.cursor()
-            
-            metadata_json = json.dumps(trade.metadata) if trade.metadata else None
-            
-            cursor.execute("""
-                INSERT OR REPLACE INTO trades 
-                (trade_id, timestamp, pair, action, volume, price, commission, pnl, strategy, confidence, metadata)
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """, (
-                trade.trade_id,
-                trade.timestamp,
-                trade.pair,
-                trade.action,
-                trade.volume,
-                trade.price,
-                trade.commission,
-                trade.pnl,
-                trade.strategy,
-                trade.confidence,
-                metadata_json
-            ))
-            
-            self.connection.commit()
+            metadata_json = _dump_json(trade.metadata) if trade.metadata else None
+            
+            with self._write_transaction() as connection:
+                connection.execute(_SQL_UPSERT_TRADE, (
+                    trade.trade_id,
+                    _to_epoch_us(trade.timestamp),
+                    trade.pair,
+                    trade.action,
+                    trade.volume,
+                    trade.price,
+                    trade.commission,
+                    trade.pnl,
+                    trade.strategy,
+                    trade.confidence,
+                    metadata_json
+                ))
+            self._stats_cache.clear()
             logger.debug(f"Stored trade record: {trade.trade_id}")
             return True
             
@@ -268,27 +568,26 @@ class DatabaseManager:
     def store_performance(self, performance: PerformanceRecord) -> bool:
         """Store performance metrics"""
         try:
-            cursor = self.connection.cursor()
-            
-            metadata_json = json.dumps(performance.metadata) if performance.metadata else None
-            
-            cursor.execute("""
-                INSERT INTO performance 
-                (timestamp, portfolio_value, total_pnl, daily_pnl, drawdown, sharpe_ratio, win_rate, total_trades, metadata)
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """, (
-                performance.timestamp,
-                performance.portfolio_value,
-                performance.total_pnl,
-                performance.daily_pnl,
-                performance.drawdown,
-                performance.sharpe_ratio,
-                performance.win_rate,
-                performance.total_trades,
-                metadata_json
-            ))
-            
-            self.connection.commit()
+            metadata_json = _dump_json(performance.metadata) if performance.metadata else None
+            
+            with self._write_transaction() as connection:
+                row = connection.execute(_SQL_INSERT_PERFORMANCE, (
+                    _to_epoch_us(performance.timestamp),
+                    performance.portfolio_value,
+                    performance.total_pnl,
+                    performance.daily_pnl,
+                    performance.drawdown,
+                    performance.sharpe_ratio,
+                    performance.win_rate,
+                    performance.total_trades,
+                    metadata_json
+                )).fetchone()
+            
+            # Only advance a cached latest row; an older, back-filled record
+            # must not replace it, and an unknown one is loaded on first read
+            latest = self._latest_performance
+            if latest is not None and row['timestamp'] >= _to_epoch_us(latest['timestamp']):
+                self._latest_performance = self._performance_row(row)
             logger.debug("Stored performance record")
             return True
             
@@ -300,19 +599,14 @@ class DatabaseManager:
                        timeframe: str = "1h") -> pd.DataFrame:
         """Retrieve market data for a specific pair and time range"""
         try:
-            query = """
-                SELECT timestamp, open_price, high_price, low_price, close_price, volume
-                FROM market_data 
-                WHERE pair = ? AND timeframe = ? AND timestamp BETWEEN ? AND ?
-                ORDER BY timestamp
-            """
-            
-            df = pd.read_sql_query(
-                query, 
-                self.connection, 
-                params=(pair, timeframe, start_time, end_time),
-                parse_dates=['timestamp']
-            )
+            with self._reader() as connection:
+                df = pd.read_sql_query(
+                    _SQL_SELECT_MARKET_DATA, 
+                    connection, 
+                    params=(pair, timeframe, _to_epoch_us(start_time), _to_epoch_us(end_time)),
+                    parse_dates={'timestamp': EPOCH_US_PARSE},
+                    **MARKET_DATA_READ_OPTIONS
+                )
             
             return df
             
@@ -320,39 +614,116 @@ class DatabaseManager:
             logger.error(f"Error retrieving market data: {e}")
             return pd.DataFrame()
     
+    def iter_market_data(self, pair: str, start_time: datetime, end_time: datetime,
+                         timeframe: str = "1h",
+                         chunksize: int = MARKET_DATA_CHUNK_SIZE) -> Iterator[pd.DataFrame]:
+        """Stream market data for a long time range in DataFrame chunks.
+        
+        Each chunk is a separate query, so no connection is held while the
+        caller works on a chunk; rows written meanwhile may show up in later
+        chunks.
+        """
+        last_key = _to_epoch_us(start_time) - 1
+        end_key = _to_epoch_us(end_time)
+        while True:
+            with self._reader() as connection:
+                df = pd.read_sql_query(
+                    _SQL_PAGE_MARKET_DATA,
+                    connection,
+                    params=(pair, timeframe, last_key, end_key, chunksize),
+                    parse_dates={'timestamp': EPOCH_US_PARSE},
+                    **MARKET_DATA_READ_OPTIONS
+                )
+            if df.empty:
+                return
+            last_key = int(df.pop('page_key').iloc[-1])
+            yield df
+            if len(df) < chunksize:
+                return
+    
+    def _build_trades_query(self, pair: Optional[str], start_time: Optional[datetime],
+                            end_time: Optional[datetime],
+                            columns: Optional[Sequence[str]],
+                            metadata_fields: Optional[Sequence[str]] = None,
+                            paged: bool = False
+                            ) -> Tuple[str, List[Any], Dict[str, Any]]:
+        """Build the trades SELECT, its parameters and the date columns to parse.
+        
+        A paged query also selects page_ts/page_id and ends with a keyset
+        condition and LIMIT, whose four parameters the caller appends.
+        """
+        if columns:
+            unknown = set(columns) - TRADE_COLUMNS
+            if unknown:
+                raise ValueError(f"Unknown trade columns: {sorted(unknown)}")
+            select = list(columns)
+            parse_dates = {
+                c: spec for c, spec in (('timestamp', EPOCH_US_PARSE), ('created_at', None))
+                if c in columns
+            }
+        else:
+            select = ['*']
+            parse_dates = {'timestamp': EPOCH_US_PARSE, 'created_at': None}
+        params = []
+        
+        # Pull individual metadata keys out in SQLite so they arrive as typed
+        # columns without decoding the whole JSON document in Python
+        for field in metadata_fields or ():
+            if not field.isidentifier():
+                raise ValueError(f"Invalid metadata field: {field!r}")
+            select.append(f"json_extract(metadata, ?) AS {field}")
+            params.append(f"$.{field}")
+        
+        if paged:
+            select = ['timestamp AS page_ts', 'id AS page_id'] + select
+        
+        query = f"SELECT {', '.join(select)} FROM trades WHERE 1=1"
+        
+        if pair:
+            query += " AND pair = ?"
+            params.append(pair)
+        
+        if start_time:
+            query += " AND timestamp >= ?"
+            params.append(_to_epoch_us(start_time))
+        
+        if end_time:
+            query += " AND timestamp <= ?"
+            params.append(_to_epoch_us(end_time))
+        
+        if paged:
+            # (timestamp, id) after the last row of the previous page
+            query += " AND timestamp >= ? AND (timestamp > ? OR id > ?)"
+            query += " ORDER BY timestamp, id LIMIT ?"
+        else:
+            query += " ORDER BY timestamp"
+        return query, params, parse_dates
+    
     def get_trades(self, pair: Optional[str] = None, start_time: Optional[datetime] = None, 
-                  end_time: Optional[datetime] = None) -> pd.DataFrame:
-        """Retrieve trade records"""
+                  end_time: Optional[datetime] = None,
+                  columns: Optional[Sequence[str]] = None,
+                  metadata_fields: Optional[Sequence[str]] = None) -> pd.DataFrame:
+        """Retrieve trade records, optionally limited to the given columns.
+        
+        Keys listed in metadata_fields are extracted from the metadata JSON
+        by SQLite and returned as extra columns of the same name.
+        """
         try:
-            query = "SELECT * FROM trades WHERE 1=1"
-            params = []
-            
-            if pair:
-                query += " AND pair = ?"
-                params.append(pair)
-            
-            if start_time:
-                query += " AND timestamp >= ?"
-                params.append(start_time)
-            
-            if end_time:
-                query += " AND timestamp <= ?"
-                params.append(end_time)
-            
-            query += " ORDER BY timestamp"
-            
-            df = pd.read_sql_query(
-                query, 
-                self.connection, 
-                params=params,
-                parse_dates=['timestamp', 'created_at']
+            query, params, parse_dates = self._build_trades_query(
+                pair, start_time, end_time, columns, metadata_fields
             )
             
+            with self._reader() as connection:
+                df = pd.read_sql_query(
+                    query, 
+                    connection, 
+                    params=params,
+                    parse_dates=parse_dates
+                )
+            
             # Parse metadata JSON
             if 'metadata' in df.columns:
-                df['metadata'] = df['metadata'].apply(
-                    lambda x: json.loads(x) if x else {}
-                )
+                df['metadata'] = df['metadata'].map(_load_json)
             
             return df
             
@@ -360,6 +731,39 @@ class DatabaseManager:
             logger.error(f"Error retrieving trades: {e}")
             return pd.DataFrame()
     
+    def iter_trades(self, pair: Optional[str] = None, start_time: Optional[datetime] = None,
+                    end_time: Optional[datetime] = None,
+                    columns: Optional[Sequence[str]] = None,
+                    metadata_fields: Optional[Sequence[str]] = None,
+                    chunksize: int = TRADES_CHUNK_SIZE) -> Iterator[pd.DataFrame]:
+        """Stream trade records in DataFrame chunks.
+        
+        Unlike get_trades, the metadata column is left as its raw JSON text;
+        callers that need it decode only the rows they use, or request single
+        keys through metadata_fields. As with iter_market_data, each chunk is
+        read by its own query.
+        """
+        query, params, parse_dates = self._build_trades_query(
+            pair, start_time, end_time, columns, metadata_fields, paged=True
+        )
+        
+        last_ts, last_id = -2**63, -1
+        while True:
+            with self._reader() as connection:
+                df = pd.read_sql_query(
+                    query,
+                    connection,
+                    params=params + [last_ts, last_ts, last_id, chunksize],
+                    parse_dates=parse_dates
+                )
+            if df.empty:
+                return
+            last_ts = int(df.pop('page_ts').iloc[-1])
+            last_id = int(df.pop('page_id').iloc[-1])
+            yield df
+            if len(df) < chunksize:
+                return
+    
     def get_performance_history(self, start_time: Optional[datetime] = None, 
                               end_time: Optional[datetime] = None) -> pd.DataFrame:
         """Retrieve performance history"""
@@ -369,20 +773,21 @@ class DatabaseManager:
             
             if start_time:
                 query += " AND timestamp >= ?"
-                params.append(start_time)
+                params.append(_to_epoch_us(start_time))
             
             if end_time:
                 query += " AND timestamp <= ?"
-                params.append(end_time)
+                params.append(_to_epoch_us(end_time))
             
             query += " ORDER BY timestamp"
             
-            df = pd.read_sql_query(
-                query, 
-                self.connection, 
-                params=params,
-                parse_dates=['timestamp', 'created_at']
-            )
+            with self._reader() as connection:
+                df = pd.read_sql_query(
+                    query, 
+                    connection, 
+                    params=params,
+                    parse_dates={'timestamp': EPOCH_US_PARSE, 'created_at': None}
+                )
             
             return df
             
@@ -395,38 +800,46 @@ class DatabaseManager:
                     indicators: Dict[str, Any]) -> bool:
         """Store trading signal"""
         try:
-            cursor = self.connection.cursor()
-            
-            indicators_json = json.dumps(indicators)
-            
-            cursor.execute("""
-                INSERT INTO signals 
-                (timestamp, pair, signal_type, action, confidence, price, indicators)
-                VALUES (?, ?, ?, ?, ?, ?, ?)
-            """, (
-                timestamp, pair, signal_type, action, confidence, price, indicators_json
-            ))
+            indicators_json = _dump_json(indicators)
             
-            self.connection.commit()
+            with self._write_transaction() as connection:
+                connection.execute(_SQL_INSERT_SIGNAL, (
+                    _to_epoch_us(timestamp), pair, signal_type, action, confidence,
+                    price, indicators_json
+                ))
             return True
             
         except Exception as e:
             logger.error(f"Error storing signal: {e}")
             return False
     
+    @staticmethod
+    def _performance_row(row: sqlite3.Row) -> Dict[str, Any]:
+        """Convert a performance row to a dict with a datetime timestamp"""
+        record = dict(row)
+        record['timestamp'] = _from_epoch_us(record['timestamp'])
+        return record
+    
     def get_latest_performance(self) -> Optional[Dict]:
-        """Get the latest performance record"""
+        """Get the latest performance record.
+        
+        The row is read once and then kept current by store_performance, so
+        repeated polls don't query the database.
+        """
+        if self._latest_performance is not None:
+            return dict(self._latest_performance)
+        
         try:
-            cursor = self.connection.cursor()
-            cursor.execute("""
-                SELECT * FROM performance 
-                ORDER BY timestamp DESC 
-                LIMIT 1
-            """)
-            
-            row = cursor.fetchone()
+            with self._reader() as connection:
+                row = connection.execute("""
+                    SELECT * FROM performance 
+                    ORDER BY timestamp DESC 
+                    LIMIT 1
+                """).fetchone()
+            
             if row:
-                return dict(row)
+                self._latest_performance = self._performance_row(row)
+                return dict(self._latest_performance)
             return None
             
         except Exception as e:
@@ -435,27 +848,47 @@ class DatabaseManager:
     
     def calculate_trade_statistics(self, pair: Optional[str] = None, 
                                  days: int = 30) -> Dict[str, Any]:
-        """Calculate trade statistics for the specified period"""
+        """Calculate trade statistics for the specified period.
+        
+        Results are reused for TRADE_STATS_CACHE_TTL seconds, or until a trade
+        is stored; if the query fails, the last result for the same arguments
+        is returned instead.
+        """
+        key = (pair, days)
+        cached = self._stats_cache.get(key)
+        if cached is not None and time.monotonic() - cached[0] < TRADE_STATS_CACHE_TTL:
+            return dict(cached[1])
+        
         try:
             start_time = datetime.now() - timedelta(days=days)
-            trades_df = self.get_trades(pair=pair, start_time=start_time)
+            query = _SQL_TRADE_STATISTICS
+            params: List[Any] = [_to_epoch_us(start_time)]
+            if pair:
+                query += " AND pair = ?"
+                params.append(pair)
             
-            if trades_df.empty:
+            # Aggregate in SQLite; only one row of totals is returned
+            with self._reader() as connection:
+                row = connection.execute(query, params).fetchone()
+            
+            total_trades = row['total_trades']
+            if not total_trades:
+                self._stats_cache[key] = (time.monotonic(), {})
                 return {}
             
-            # Calculate statistics
-            total_trades = len(trades_df)
-            winning_trades = len(trades_df[trades_df['pnl'] > 0])
-            losing_trades = len(trades_df[trades_df['pnl'] < 0])
+            winning_trades = row['winning_trades']
+            losing_trades = row['losing_trades']
+            total_pnl = row['total_pnl']
+            gross_profit = row['gross_profit']
+            gross_loss = row['gross_loss']
             
             win_rate = winning_trades / total_trades if total_trades > 0 else 0
-            total_pnl = trades_df['pnl'].sum()
-            avg_win = trades_df[trades_df['pnl'] > 0]['pnl'].mean() if winning_trades > 0 else 0
-            avg_loss = trades_df[trades_df['pnl'] < 0]['pnl'].mean() if losing_trades > 0 else 0
+            avg_win = gross_profit / winning_trades if winning_trades > 0 else 0
+            avg_loss = gross_loss / losing_trades if losing_trades > 0 else 0
             
-            profit_factor = abs(avg_win * winning_trades / (avg_loss * losing_trades)) if avg_loss != 0 and losing_trades > 0 else 0
+            profit_factor = abs(gross_profit / gross_loss) if gross_loss != 0 else 0
             
-            return {
+            stats = {
                 'total_trades': total_trades,
                 'winning_trades': winning_trades,
                 'losing_trades': losing_trades,
@@ -466,37 +899,71 @@ class DatabaseManager:
                 'profit_factor': profit_factor,
                 'period_days': days
             }
+            self._stats_cache[key] = (time.monotonic(), stats)
+            return dict(stats)
             
         except Exception as e:
             logger.error(f"Error calculating trade statistics: {e}")
+            if cached is not None:
+                return dict(cached[1])
             return {}
     
     def cleanup_old_data(self, days_to_keep: int = 365):
         """Clean up old data to manage database size"""
         try:
             cutoff_date = datetime.now() - timedelta(days=days_to_keep)
-            cursor = self.connection.cursor()
-            
-            # Clean up old market data (keep more recent data)
-            cursor.execute("DELETE FROM market_data WHERE timestamp < ?", (cutoff_date,))
             
-            # Clean up old signals (keep less)
-            signal_cutoff = datetime.now() - timedelta(days=90)
-            cursor.execute("DELETE FROM signals WHERE timestamp < ?", (signal_cutoff,))
-            
-            # Keep all trades and performance data (important for analysis)
-            
-            self.connection.commit()
+            with self._write_transaction() as connection:
+                # Clean up old market data (keep more recent data)
+                connection.execute("DELETE FROM market_data WHERE timestamp < ?",
+                                   (_to_epoch_us(cutoff_date),))
+                
+                # Clean up old signals (keep less)
+                signal_cutoff = datetime.now() - timedelta(days=90)
+                connection.execute("DELETE FROM signals WHERE timestamp < ?",
+                                   (_to_epoch_us(signal_cutoff),))
+                
+                # Keep all trades and performance data (important for analysis)
+            
+            self._reclaim_free_space()
             logger.info(f"Cleaned up data older than {days_to_keep} days")
             
         except Exception as e:
             logger.error(f"Error cleaning up old data: {e}")
     
+    def _reclaim_free_space(self):
+        """Shrink the database file and WAL after rows have been deleted"""
+        with self._write_lock:
+            if self.connection.execute("PRAGMA auto_vacuum").fetchone()[0] != 2:
+                # Created before incremental auto-vacuum; a one-off VACUUM
+                # rebuilds the file with the mode set at init
+                self.connection.execute("VACUUM")
+            else:
+                # executescript steps the pragma to completion; execute()
+                # would stop after freeing a single page
+                self.connection.executescript(
+                    f"PRAGMA incremental_vacuum({INCREMENTAL_VACUUM_PAGES})"
+                )
+            if self._read_uri is not None:
+                self.connection.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+    
     def backup_database(self, backup_path: str) -> bool:
         """Create a backup of the database"""
         try:
-            import shutil
-            shutil.copy2(self.db_path, backup_path)
+            if self._read_uri is not None:
+                # Fold the WAL back into the main file first so the copy
+                # starts from a compact database
+                with self._write_lock:
+                    self.connection.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+            
+            # Use the online backup API in page steps from a reader, so a
+            # hot backup sees a consistent snapshot without stalling writers
+            backup = sqlite3.connect(backup_path)
+            try:
+                with self._reader() as connection:
+                    connection.backup(backup, pages=BACKUP_PAGES_PER_STEP, sleep=0)
+            finally:
+                backup.close()
             logger.info(f"Database backed up to: {backup_path}")
             return True
             
@@ -505,7 +972,45 @@ class DatabaseManager:
             return False
     
     def close(self):
-        """Close database connection"""
-        if hasattr(self, 'connection'):
+        """Release this holder's use of the database.
+        
+        The connections stay open until the last holder of a shared manager
+        closes it, so the file and its WAL are not reopened between users.
+        """
+        with _shared_managers_lock:
+            self._users -= 1
+            if self._users > 0:
+                return
+            if _shared_managers.get(self.db_path) is self:
+                del _shared_managers[self.db_path]
+        
+        if getattr(self, 'connection', None) is not None:
             self.connection.close()
+            self.connection = None
+            with self._write_lock:
+                for reader in self._readers:
+                    reader.close()
+                self._readers.clear()
+                self._reader_pool = queue.LifoQueue()
             logger.info("Database connection closed")
+
+
+# Long-lived managers shared by every component using the same database file
+_shared_managers: Dict[str, DatabaseManager] = {}
+_shared_managers_lock = threading.Lock()
+
+
+def get_database_manager(db_path: str = "data/trading_bot.db") -> DatabaseManager:
+    """Return the process-wide DatabaseManager for a database file.
+    
+    The first call opens the database; later calls reuse the open manager.
+    Every caller should call close() once when done with it.
+    """
+    with _shared_managers_lock:
+        manager = _shared_managers.get(db_path)
+        if manager is None:
+            manager = DatabaseManager(db_path)
+            _shared_managers[db_path] = manager
+        else:
+            manager._users += 1
+        return manager
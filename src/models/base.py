@@ -2,11 +2,16 @@
 Base Database Models and Configuration
 """
 
-from datetime import datetime
+from contextlib import contextmanager
 from sqlalchemy import create_engine, Column, Integer, DateTime, String
+from sqlalchemy.ext.compiler import compiles
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker
+from sqlalchemy.sql.expression import FunctionElement
+from sqlalchemy.dialects.postgresql import insert as postgresql_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
 from flask_sqlalchemy import SQLAlchemy
+import keyword
 import uuid
 
 # SQLAlchemy setup
@@ -14,33 +19,79 @@ db = SQLAlchemy()
 Base = declarative_base()
 
 
+class utcnow(FunctionElement):
+    """Current UTC time evaluated by the database"""
+
+    type = DateTime()
+    inherit_cache = True
+
+
+@compiles(utcnow)
+def _compile_utcnow(element, compiler, **kw):
+    # SQLite's CURRENT_TIMESTAMP is already UTC
+    return "CURRENT_TIMESTAMP"
+
+
+@compiles(utcnow, "postgresql")
+def _compile_utcnow_postgresql(element, compiler, **kw):
+    return "TIMEZONE('utc', CURRENT_TIMESTAMP)"
+
+
+@compiles(utcnow, "mysql")
+def _compile_utcnow_mysql(element, compiler, **kw):
+    return "UTC_TIMESTAMP()"
+
+
 class BaseModel(db.Model):
     """Base model with common fields"""
 
     __abstract__ = True
+    # Read server-generated timestamps back in the INSERT/UPDATE (RETURNING)
+    __mapper_args__ = {"eager_defaults": True}
 
     id = db.Column(db.Integer, primary_key=True)
-    created_at = db.Column(db.DateTime, default=datetime.utcnow, nullable=False)
+    created_at = db.Column(db.DateTime, server_default=utcnow(), nullable=False)
     updated_at = db.Column(
-        db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False
+        db.DateTime, server_default=utcnow(), onupdate=utcnow(), nullable=False
     )
 
     def to_dict(self):
         """Convert model to dictionary"""
-        return {
-            column.name: getattr(self, column.name) for column in self.__table__.columns
-        }
+        serializer = type(self).__dict__.get("_to_dict")
+        if serializer is None:
+            serializer = type(self)._build_to_dict()
+        return serializer(self)
+
+    @classmethod
+    def _build_to_dict(cls):
+        """Generate a flat dict-literal serializer for this model's columns.
+
+        Built on first use, once the table is mapped, and cached on the class
+        so later calls skip the per-column introspection.
+        """
+        items = []
+        for column in cls.__table__.columns:
+            name = column.name
+            if name.isidentifier() and not keyword.iskeyword(name):
+                items.append(f"{name!r}: self.{name}")
+            else:
+                items.append(f"{name!r}: getattr(self, {name!r})")
+        source = "def _to_dict(self):\n    return {%s}\n" % ", ".join(items)
+        namespace = {}
+        exec(compile(source, f"<{cls.__name__}.to_dict>", "exec"), namespace)
+        cls._to_dict = namespace["_to_dict"]
+        return cls._to_dict
 
     def save(self):
-        """Save model to database"""
+        """Add model to the session and flush it; committed with the request"""
         db.session.add(self)
-        db.session.commit()
+        db.session.flush()
         return self
 
     def delete(self):
-        """Delete model from database"""
+        """Delete model and flush; committed with the request"""
         db.session.delete(self)
-        db.session.commit()
+        db.session.flush()
 
 
 class TenantMixin:
@@ -53,10 +104,18 @@ class TenantMixin:
     @classmethod
     def get_for_user(cls, user_id, **filters):
         """Get records for specific user"""
-        query = cls.query.filter_by(user_id=user_id)
-        for key, value in filters.items():
-            query = query.filter(getattr(cls, key) == value)
-        return query
+        return cls.query.filter_by(user_id=user_id, **filters)
+
+
+@contextmanager
+def transaction():
+    """Commit the session if the block succeeds, roll it back if it raises"""
+    try:
+        yield db.session
+        db.session.commit()
+    except Exception:
+        db.session.rollback()
+        raise
 
 
 def generate_uuid():
@@ -79,6 +138,39 @@ def init_db(app):
         create_default_plans()
 
 
+# Plan features mirrored by SubscriptionPlan columns, where NULL means unlimited
+PLAN_LIMIT_FEATURES = ("max_bots", "max_pairs", "api_calls_per_hour")
+
+
+def _parse_plan_limit(value):
+    """Convert a limit feature value to its column value"""
+    return None if value == "unlimited" else int(value)
+
+
+def _plan_limits(features):
+    """Column values for the limit features in a plan's feature list"""
+    return {
+        feature["name"]: _parse_plan_limit(feature["value"])
+        for feature in features
+        if feature["name"] in PLAN_LIMIT_FEATURES
+    }
+
+
+def _insert_ignore(table, index_elements):
+    """Build an INSERT that skips rows conflicting on a unique key"""
+    dialect = db.engine.dialect.name
+    if dialect == "postgresql":
+        return postgresql_insert(table).on_conflict_do_nothing(
+            index_elements=index_elements
+        )
+    if dialect == "sqlite":
+        return sqlite_insert(table).on_conflict_do_nothing(
+            index_elements=index_elements
+        )
+    # MySQL / MariaDB
+    return table.insert().prefix_with("IGNORE")
+
+
 def create_default_plans():
     """Create default subscription plans"""
     plans_data = [
@@ -276,27 +368,43 @@ def create_default_plans():
 
     from .subscription import SubscriptionPlan, PlanFeature
 
-    for plan_data in plans_data:
-        # Check if plan already exists
-        existing_plan = SubscriptionPlan.query.filter_by(name=plan_data["name"]).first()
-        if existing_plan:
-            continue
-
-        # Create plan
-        plan = SubscriptionPlan(
-            name=plan_data["name"],
-            price=plan_data["price"],
-            billing_cycle=plan_data["billing_cycle"],
-            description=plan_data["description"],
+    # Existing plans and features are left untouched by the conflict clause,
+    # so no per-plan existence checks are needed
+    db.session.execute(
+        _insert_ignore(SubscriptionPlan.__table__, ["name"]),
+        [
+            {
+                "name": plan["name"],
+                "price": plan["price"],
+                "billing_cycle": plan["billing_cycle"],
+                "description": plan["description"],
+                **_plan_limits(plan["features"]),
+            }
+            for plan in plans_data
+        ],
+    )
+    plan_ids = dict(
+        db.session.query(SubscriptionPlan.name, SubscriptionPlan.id).filter(
+            SubscriptionPlan.name.in_([plan["name"] for plan in plans_data])
         )
-        plan.save()
-
-        # Create features
-        for feature_data in plan_data["features"]:
-            feature = PlanFeature(
-                plan_id=plan.id,
-                name=feature_data["name"],
-                value=feature_data["value"],
-                description=feature_data["description"],
-            )
-            feature.save()
+    )
+    db.session.execute(
+        _insert_ignore(PlanFeature.__table__, ["plan_id", "name"]),
+        [
+            dict(feature, plan_id=plan_ids[plan["name"]])
+            for plan in plans_data
+            for feature in plan["features"]
+        ],
+    )
+
+    # Plans created before the limit columns were filled in still carry the
+    # column defaults; take their limits from the features once
+    legacy_plans = SubscriptionPlan.with_features().filter_by(
+        max_bots=1, max_pairs=1, api_calls_per_hour=100
+    )
+    for plan in legacy_plans:
+        for name, value in _plan_limits(
+            [{"name": f.name, "value": f.value} for f in plan.features]
+        ).items():
+            setattr(plan, name, value)
+    db.session.commit()
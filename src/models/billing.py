@@ -3,7 +3,13 @@ Billing and Payment Models
 """
 
 from datetime import datetime
+from flask import current_app, has_app_context
 from sqlalchemy import (
+    and_,
+    event,
+    inspect,
+    select,
+    update,
     Column,
     Integer,
     String,
@@ -13,16 +19,66 @@ from sqlalchemy import (
     ForeignKey,
     Numeric,
 )
-from sqlalchemy.orm import relationship
+from sqlalchemy.ext.hybrid import hybrid_property
+from sqlalchemy.orm import (
+    Session,
+    deferred,
+    object_session,
+    relationship,
+    undefer_group,
+)
 import json
+import logging
+import uuid
+
+from .base import db, BaseModel, utcnow
+
+try:
+    from redis import RedisError
+except ImportError:
+    RedisError = Exception
+
+logger = logging.getLogger(__name__)
+
+# Seconds a cached invoice line_items blob is kept in Redis
+LINE_ITEMS_CACHE_TTL = 3600
+
+
+def _line_items_cache():
+    """The Redis client registered by create_app, if any"""
+    return current_app.extensions.get("redis") if has_app_context() else None
 
-from .base import db, BaseModel
+
+def _line_items_key(invoice_id):
+    return f"invoice:{invoice_id}:line_items"
+
+
+def _summary_columns(model):
+    """The model's non-deferred columns, for read-only list queries
+
+    Selecting columns instead of entities skips the identity map and
+    per-row instance state, which adds up on long listings.
+    """
+    return [
+        getattr(model, attr.key)
+        for attr in inspect(model).column_attrs
+        if not attr.deferred
+    ]
 
 
 class Invoice(BaseModel):
     """Invoice model"""
 
     __tablename__ = "invoices"
+    __table_args__ = (
+        # Overdue sweeps only ever look at pending invoices
+        db.Index(
+            "ix_invoices_pending_due_date",
+            "due_date",
+            postgresql_where=db.text("status = 'pending'"),
+            sqlite_where=db.text("status = 'pending'"),
+        ),
+    )
 
     user_id = db.Column(db.Integer, db.ForeignKey("users.id"), nullable=False)
     invoice_number = db.Column(db.String(50), unique=True, nullable=False)
@@ -51,8 +107,8 @@ class Invoice(BaseModel):
     stripe_invoice_id = db.Column(db.String(255), unique=True)
     payment_method = db.Column(db.String(50))
 
-    # Invoice items (JSON)
-    line_items = db.Column(db.JSON)
+    # Invoice items (JSON); only loaded when accessed or undeferred
+    line_items = deferred(db.Column(db.JSON), group="details")
 
     # Relationships
     user = relationship("User", back_populates="invoices")
@@ -63,15 +119,32 @@ class Invoice(BaseModel):
         if not self.invoice_number:
             self.generate_invoice_number()
 
+    @classmethod
+    def with_details(cls):
+        """Query invoices with the deferred detail columns loaded"""
+        return cls.query.options(undefer_group("details"))
+
+    @classmethod
+    def summaries(cls):
+        """Query invoice list rows as plain tuples instead of instances"""
+        return db.session.query(
+            *_summary_columns(cls), cls.is_overdue.label("is_overdue")
+        )
+
     def generate_invoice_number(self):
         """Generate unique invoice number"""
-        timestamp = datetime.utcnow().strftime("%Y%m%d%H%M%S")
-        self.invoice_number = f"INV-{timestamp}-{self.user_id}"
+        # Random rather than timestamp-based, so invoices created in the same
+        # second (e.g. in bulk) never collide on the unique constraint
+        self.invoice_number = f"INV-{uuid.uuid4().hex[:12].upper()}"
 
-    def mark_paid(self, payment_date=None):
-        """Mark invoice as paid"""
+    def _set_paid(self, payment_date=None):
+        """Set paid status without saving"""
         self.status = "paid"
         self.paid_date = payment_date or datetime.utcnow()
+
+    def mark_paid(self, payment_date=None):
+        """Mark invoice as paid"""
+        self._set_paid(payment_date)
         self.save()
 
     def mark_failed(self):
@@ -84,45 +157,82 @@ class Invoice(BaseModel):
         self.status = "cancelled"
         self.save()
 
+    @hybrid_property
     def is_overdue(self):
         """Check if invoice is overdue"""
         return self.due_date < datetime.utcnow() and self.status == "pending"
 
-    def to_dict(self):
-        """Convert to dictionary"""
+    @is_overdue.expression
+    def is_overdue(cls):
+        return and_(cls.due_date < utcnow(), cls.status == "pending")
+
+    def to_dict(self, include_details=True):
+        """Convert to dictionary, optionally without the deferred columns"""
+        data = self.summary_dict(self)
+        if include_details:
+            data["line_items"] = self._cached_line_items()
+        return data
+
+    @staticmethod
+    def summary_dict(row):
+        """Serialize an instance or a summaries() row, minus deferred columns"""
         return {
-            "id": self.id,
-            "user_id": self.user_id,
-            "invoice_number": self.invoice_number,
-            "amount": float(self.amount),
-            "tax_amount": float(self.tax_amount),
-            "total_amount": float(self.total_amount),
-            "currency": self.currency,
-            "status": self.status,
-            "issue_date": self.issue_date.isoformat(),
-            "due_date": self.due_date.isoformat(),
-            "paid_date": self.paid_date.isoformat() if self.paid_date else None,
+            "id": row.id,
+            "user_id": row.user_id,
+            "invoice_number": row.invoice_number,
+            "amount": float(row.amount),
+            "tax_amount": float(row.tax_amount),
+            "total_amount": float(row.total_amount),
+            "currency": row.currency,
+            "status": row.status,
+            "issue_date": row.issue_date.isoformat(),
+            "due_date": row.due_date.isoformat(),
+            "paid_date": row.paid_date.isoformat() if row.paid_date else None,
             "billing_period_start": (
-                self.billing_period_start.isoformat()
-                if self.billing_period_start
+                row.billing_period_start.isoformat()
+                if row.billing_period_start
                 else None
             ),
             "billing_period_end": (
-                self.billing_period_end.isoformat() if self.billing_period_end else None
+                row.billing_period_end.isoformat() if row.billing_period_end else None
             ),
-            "stripe_invoice_id": self.stripe_invoice_id,
-            "payment_method": self.payment_method,
-            "line_items": self.line_items,
-            "is_overdue": self.is_overdue(),
-            "created_at": self.created_at.isoformat(),
-            "updated_at": self.updated_at.isoformat(),
+            "stripe_invoice_id": row.stripe_invoice_id,
+            "payment_method": row.payment_method,
+            "is_overdue": bool(row.is_overdue),
+            "created_at": row.created_at.isoformat(),
+            "updated_at": row.updated_at.isoformat(),
         }
 
+    def _cached_line_items(self):
+        """line_items through the Redis cache
+
+        A hit never touches the deferred column, so callers should not
+        undefer it. The entry is deleted once a change to line_items is
+        committed (see _evict_stale_line_items).
+        """
+        cache = _line_items_cache()
+        if cache is None or self.id is None:
+            return self.line_items
+
+        key = _line_items_key(self.id)
+        try:
+            cached = cache.get(key)
+            if cached is not None:
+                return json.loads(cached)
+            line_items = self.line_items
+            cache.set(key, json.dumps(line_items), ex=LINE_ITEMS_CACHE_TTL)
+            return line_items
+        except RedisError:
+            return self.line_items
+
 
 class Payment(BaseModel):
     """Payment model"""
 
     __tablename__ = "payments"
+    __table_args__ = (
+        db.Index("ix_payments_status_created_at", "status", "created_at"),
+    )
 
     user_id = db.Column(db.Integer, db.ForeignKey("users.id"), nullable=False)
     invoice_id = db.Column(db.Integer, db.ForeignKey("invoices.id"))
@@ -146,32 +256,97 @@ class Payment(BaseModel):
     payment_date = db.Column(db.DateTime)
     refund_date = db.Column(db.DateTime)
 
-    # Additional info
-    description = db.Column(db.Text)
-    payment_metadata = db.Column(db.JSON)
+    # Additional info; only loaded when accessed or undeferred
+    description = deferred(db.Column(db.Text), group="details")
+    payment_metadata = deferred(db.Column(db.JSON), group="details")
 
     # Relationships
     user = relationship("User", back_populates="payments")
     invoice = relationship("Invoice", back_populates="payments")
 
+    @classmethod
+    def with_details(cls):
+        """Query payments with the deferred detail columns loaded"""
+        return cls.query.options(undefer_group("details"))
+
+    @classmethod
+    def summaries(cls):
+        """Query payment list rows as plain tuples instead of instances"""
+        return db.session.query(*_summary_columns(cls))
+
+    @classmethod
+    def mark_many_completed(cls, payment_ids, payment_date=None):
+        """Mark payments and their invoices as completed/paid"""
+        payment_date = payment_date or datetime.utcnow()
+        cls._bulk_transition(
+            payment_ids,
+            {"status": "completed", "payment_date": payment_date},
+            {"status": "paid", "paid_date": payment_date},
+        )
+
+    @classmethod
+    def mark_many_failed(cls, payment_ids):
+        """Mark payments and their invoices as failed"""
+        cls._bulk_transition(payment_ids, {"status": "failed"}, {"status": "failed"})
+
+    @classmethod
+    def _bulk_transition(cls, payment_ids, payment_values, invoice_values):
+        """Apply a status change to payments and their invoices.
+
+        Both UPDATEs run in the current transaction; callers outside a
+        request commit it, e.g. with transaction().
+        """
+        payment_ids = list(payment_ids)
+        if not payment_ids:
+            return
+        invoice_ids = select(cls.invoice_id).where(
+            cls.id.in_(payment_ids), cls.invoice_id.isnot(None)
+        )
+        db.session.execute(
+            update(cls).where(cls.id.in_(payment_ids)).values(**payment_values)
+        )
+        db.session.execute(
+            update(Invoice).where(Invoice.id.in_(invoice_ids)).values(**invoice_values)
+        )
+
     def mark_completed(self, payment_date=None):
         """Mark payment as completed"""
         self.status = "completed"
         self.payment_date = payment_date or datetime.utcnow()
-        self.save()
 
-        # Mark associated invoice as paid
-        if self.invoice:
-            self.invoice.mark_paid(self.payment_date)
+        # Mark associated invoice as paid in the same commit
+        self._update_invoice(status="paid", paid_date=self.payment_date)
+        self.save()
 
     def mark_failed(self):
         """Mark payment as failed"""
         self.status = "failed"
+
+        # Mark associated invoice as failed in the same commit
+        self._update_invoice(status="failed")
         self.save()
 
-        # Mark associated invoice as failed
-        if self.invoice:
-            self.invoice.mark_failed()
+    def _update_invoice(self, **values):
+        """Set values on the associated invoice without loading it"""
+        if self.invoice_id is None:
+            # Only linked through a not yet flushed relationship
+            invoice = self.__dict__.get("invoice")
+            if invoice is not None:
+                for key, value in values.items():
+                    setattr(invoice, key, value)
+            return
+        db.session.execute(
+            update(Invoice).where(Invoice.id == self.invoice_id).values(**values),
+            execution_options={"synchronize_session": False},
+        )
+        # synchronize_session can't be relied on to bring a copy already in
+        # the session up to date (e.g. one inserted earlier in this session),
+        # so expire it and let it reload the row on next access
+        invoice = db.session.identity_map.get(
+            db.session.identity_key(Invoice, self.invoice_id)
+        )
+        if invoice is not None:
+            db.session.expire(invoice, list(values))
 
     def mark_refunded(self, refund_date=None):
         """Mark payment as refunded"""
@@ -179,27 +354,34 @@ class Payment(BaseModel):
         self.refund_date = refund_date or datetime.utcnow()
         self.save()
 
-    def to_dict(self):
-        """Convert to dictionary"""
+    def to_dict(self, include_details=True):
+        """Convert to dictionary, optionally without the deferred columns"""
+        data = self.summary_dict(self)
+        if include_details:
+            data["description"] = self.description
+            data["metadata"] = self.payment_metadata
+        return data
+
+    @staticmethod
+    def summary_dict(row):
+        """Serialize an instance or a summaries() row, minus deferred columns"""
         return {
-            "id": self.id,
-            "user_id": self.user_id,
-            "invoice_id": self.invoice_id,
-            "amount": float(self.amount),
-            "currency": self.currency,
-            "payment_method": self.payment_method,
-            "status": self.status,
-            "stripe_payment_intent_id": self.stripe_payment_intent_id,
-            "stripe_charge_id": self.stripe_charge_id,
-            "transaction_id": self.transaction_id,
+            "id": row.id,
+            "user_id": row.user_id,
+            "invoice_id": row.invoice_id,
+            "amount": float(row.amount),
+            "currency": row.currency,
+            "payment_method": row.payment_method,
+            "status": row.status,
+            "stripe_payment_intent_id": row.stripe_payment_intent_id,
+            "stripe_charge_id": row.stripe_charge_id,
+            "transaction_id": row.transaction_id,
             "payment_date": (
-                self.payment_date.isoformat() if self.payment_date else None
+                row.payment_date.isoformat() if row.payment_date else None
             ),
-            "refund_date": self.refund_date.isoformat() if self.refund_date else None,
-            "description": self.description,
-            "metadata": self.payment_metadata,
-            "created_at": self.created_at.isoformat(),
-            "updated_at": self.updated_at.isoformat(),
+            "refund_date": row.refund_date.isoformat() if row.refund_date else None,
+            "created_at": row.created_at.isoformat(),
+            "updated_at": row.updated_at.isoformat(),
         }
 
 
@@ -249,3 +431,40 @@ class BillingAddress(BaseModel):
             "created_at": self.created_at.isoformat(),
             "updated_at": self.updated_at.isoformat(),
         }
+
+
+# Evict cached line_items once a change to them is committed. Deleting at
+# flush time instead would let a concurrent reader cache the old, still
+# committed value again.
+def _mark_line_items_stale(invoice):
+    session = object_session(invoice)
+    if session is not None:
+        session.info.setdefault("stale_line_items", set()).add(invoice.id)
+
+
+@event.listens_for(Invoice, "after_update")
+def _invoice_updated(mapper, connection, invoice):
+    if inspect(invoice).attrs.line_items.history.has_changes():
+        _mark_line_items_stale(invoice)
+
+
+@event.listens_for(Invoice, "after_delete")
+def _invoice_deleted(mapper, connection, invoice):
+    _mark_line_items_stale(invoice)
+
+
+@event.listens_for(Session, "after_commit")
+def _evict_stale_line_items(session):
+    invoice_ids = session.info.pop("stale_line_items", None)
+    cache = _line_items_cache()
+    if not invoice_ids or cache is None:
+        return
+    try:
+        cache.delete(*(_line_items_key(invoice_id) for invoice_id in invoice_ids))
+    except RedisError as e:
+        logger.warning(f"Could not evict cached invoice line items: {e}")
+
+
+@event.listens_for(Session, "after_rollback")
+def _forget_stale_line_items(session):
+    session.info.pop("stale_line_items", None)
@@ -4,10 +4,12 @@ Subscription and Billing Models
 
 from datetime import datetime, timedelta
 from sqlalchemy import Column, Integer, String, Boolean, DateTime, Text, ForeignKey, Numeric
-from sqlalchemy.orm import relationship
+from sqlalchemy import and_, event
+from sqlalchemy.ext.hybrid import hybrid_property
+from sqlalchemy.orm import relationship, selectinload
 import json
 
-from .base import db, BaseModel
+from .base import db, BaseModel, PLAN_LIMIT_FEATURES, utcnow
 
 
 class SubscriptionPlan(BaseModel):
@@ -20,7 +22,7 @@ class SubscriptionPlan(BaseModel):
     description = db.Column(db.Text)
     is_active = db.Column(db.Boolean, default=True)
     
-    # Plan metadata
+    # Plan limits; NULL means unlimited
     max_bots = db.Column(db.Integer, default=1)
     max_pairs = db.Column(db.Integer, default=1)
     api_calls_per_hour = db.Column(db.Integer, default=100)
@@ -29,14 +31,35 @@ class SubscriptionPlan(BaseModel):
     features = relationship("PlanFeature", back_populates="plan", cascade="all, delete-orphan")
     subscriptions = relationship("Subscription", back_populates="plan")
     
+    @classmethod
+    def with_features(cls):
+        """Query plans with their features eager-loaded"""
+        return cls.query.options(selectinload(cls.features))
+    
+    @property
+    def _feature_map(self):
+        """Feature values by name, built once per loaded instance"""
+        feature_map = self.__dict__.get('_feature_values')
+        if feature_map is None:
+            feature_map = {f.name: f.value for f in self.features}
+            self.__dict__['_feature_values'] = feature_map
+        return feature_map
+    
+    def _reset_feature_map(self):
+        """Drop the cached feature values"""
+        self.__dict__.pop('_feature_values', None)
+    
     def get_feature_value(self, feature_name):
         """Get feature value by name"""
-        feature = next((f for f in self.features if f.name == feature_name), None)
-        return feature.value if feature else None
+        if feature_name in PLAN_LIMIT_FEATURES:
+            # Answered by the limit column, without loading the features
+            limit = getattr(self, feature_name)
+            return 'unlimited' if limit is None else str(limit)
+        return self._feature_map.get(feature_name)
     
     def has_feature(self, feature_name):
         """Check if plan has specific feature"""
-        return any(f.name == feature_name for f in self.features)
+        return feature_name in self._feature_map
     
     def to_dict(self):
         """Convert to dictionary"""
@@ -59,6 +82,9 @@ class SubscriptionPlan(BaseModel):
 class PlanFeature(BaseModel):
     """Plan feature model"""
     __tablename__ = 'plan_features'
+    __table_args__ = (
+        db.UniqueConstraint('plan_id', 'name', name='uq_plan_features_plan_id_name'),
+    )
     
     plan_id = db.Column(db.Integer, db.ForeignKey('subscription_plans.id'), nullable=False)
     name = db.Column(db.String(100), nullable=False)
@@ -84,6 +110,9 @@ class PlanFeature(BaseModel):
 class Subscription(BaseModel):
     """User subscription model"""
     __tablename__ = 'subscriptions'
+    __table_args__ = (
+        db.Index('ix_subscriptions_status_end_date', 'status', 'end_date'),
+    )
     
     user_id = db.Column(db.Integer, db.ForeignKey('users.id'), nullable=False, unique=True)
     plan_id = db.Column(db.Integer, db.ForeignKey('subscription_plans.id'), nullable=False)
@@ -111,18 +140,35 @@ class Subscription(BaseModel):
     
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
-        if not self.end_date and self.plan:
+        if not self.end_date:
             self.calculate_end_date()
     
+    @classmethod
+    def with_plan(cls):
+        """Query subscriptions with their plan and its features eager-loaded"""
+        return cls.query.options(
+            selectinload(cls.plan).selectinload(SubscriptionPlan.features)
+        )
+    
     def calculate_end_date(self):
         """Calculate subscription end date based on billing cycle"""
-        if self.plan.billing_cycle == 'monthly':
+        # Callers usually set plan_id only, leaving self.plan unloaded (or
+        # stale after a plan change); the plan they just looked up is in the
+        # identity map, so this normally costs no query
+        plan = db.session.get(SubscriptionPlan, self.plan_id) if self.plan_id else self.plan
+        if plan is None:
+            return
+        if self.start_date is None:
+            self.start_date = datetime.utcnow()
+        
+        if plan.billing_cycle == 'monthly':
             self.end_date = self.start_date + timedelta(days=30)
             self.next_billing_date = self.end_date
-        elif self.plan.billing_cycle == 'yearly':
+        elif plan.billing_cycle == 'yearly':
             self.end_date = self.start_date + timedelta(days=365)
             self.next_billing_date = self.end_date
     
+    @hybrid_property
     def is_active(self):
         """Check if subscription is active"""
         return (
@@ -130,13 +176,22 @@ class Subscription(BaseModel):
             self.end_date > datetime.utcnow()
         )
     
+    @is_active.expression
+    def is_active(cls):
+        return and_(cls.status == 'active', cls.end_date > utcnow())
+    
+    @hybrid_property
     def is_expired(self):
         """Check if subscription is expired"""
         return self.end_date <= datetime.utcnow()
     
+    @is_expired.expression
+    def is_expired(cls):
+        return cls.end_date <= utcnow()
+    
     def days_remaining(self):
         """Get days remaining in subscription"""
-        if self.is_expired():
+        if self.is_expired:
             return 0
         return (self.end_date - datetime.utcnow()).days
     
@@ -173,39 +228,38 @@ class Subscription(BaseModel):
     
     def can_create_bot(self):
         """Check if user can create another bot"""
-        max_bots = self.get_feature_value('max_bots')
-        if max_bots == 'unlimited':
-            return True
-        return self.current_bots < int(max_bots)
+        max_bots = self.plan.max_bots
+        return max_bots is None or self.current_bots < max_bots
     
     def can_add_pair(self):
         """Check if user can add another trading pair"""
-        max_pairs = self.get_feature_value('max_pairs')
-        if max_pairs == 'unlimited':
-            return True
-        return self.current_pairs < int(max_pairs)
+        max_pairs = self.plan.max_pairs
+        return max_pairs is None or self.current_pairs < max_pairs
+    
+    def _adjust_usage(self, column, delta):
+        """Atomically add delta to a usage counter, never going below zero"""
+        query = Subscription.query.filter_by(id=self.id)
+        if delta < 0:
+            query = query.filter(column >= -delta)
+        query.update({column: column + delta}, synchronize_session=False)
+        # Read the new count back from the database on next access
+        db.session.expire(self, [column.key])
     
     def increment_bot_count(self):
         """Increment bot count"""
-        self.current_bots += 1
-        self.save()
+        self._adjust_usage(Subscription.current_bots, 1)
     
     def decrement_bot_count(self):
         """Decrement bot count"""
-        if self.current_bots > 0:
-            self.current_bots -= 1
-            self.save()
+        self._adjust_usage(Subscription.current_bots, -1)
     
     def increment_pair_count(self):
         """Increment pair count"""
-        self.current_pairs += 1
-        self.save()
+        self._adjust_usage(Subscription.current_pairs, 1)
     
     def decrement_pair_count(self):
         """Decrement pair count"""
-        if self.current_pairs > 0:
-            self.current_pairs -= 1
-            self.save()
+        self._adjust_usage(Subscription.current_pairs, -1)
     
     def to_dict(self):
         """Convert to dictionary"""
@@ -219,10 +273,24 @@ class Subscription(BaseModel):
             'next_billing_date': self.next_billing_date.isoformat() if self.next_billing_date else None,
             'cancelled_at': self.cancelled_at.isoformat() if self.cancelled_at else None,
             'days_remaining': self.days_remaining(),
-            'is_active': self.is_active(),
+            'is_active': self.is_active,
             'current_bots': self.current_bots,
             'current_pairs': self.current_pairs,
             'stripe_subscription_id': self.stripe_subscription_id,
             'created_at': self.created_at.isoformat(),
             'updated_at': self.updated_at.isoformat()
         }
+
+
+# Rebuild SubscriptionPlan._feature_map when its features collection changes
+# or the plan is expired or refreshed (e.g. after a commit)
+def _reset_plan_feature_map(plan, *args):
+    # Expiry can fire for an instance that has already been garbage collected
+    if plan is not None:
+        plan._reset_feature_map()
+
+
+for _identifier in ('append', 'remove', 'bulk_replace'):
+    event.listen(SubscriptionPlan.features, _identifier, _reset_plan_feature_map)
+for _identifier in ('expire', 'refresh'):
+    event.listen(SubscriptionPlan, _identifier, _reset_plan_feature_map)
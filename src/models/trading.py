@@ -4,6 +4,7 @@ Trading-related Models for Multi-tenant Support
 
 from datetime import datetime
 from sqlalchemy import Column, Integer, String, Boolean, DateTime, Text, ForeignKey, Numeric, JSON
+from sqlalchemy import bindparam, update
 from sqlalchemy.orm import relationship
 import json
 
@@ -162,17 +163,56 @@ class UserBot(BaseModel, TenantMixin):
         self.last_heartbeat = datetime.utcnow()
         self.save()
     
+    @classmethod
+    def heartbeat_many(cls, bot_ids):
+        """Update the heartbeat of several bots with one UPDATE"""
+        bot_ids = list(bot_ids)
+        if bot_ids:
+            cls.query.filter(cls.id.in_(bot_ids)).update(
+                {cls.last_heartbeat: datetime.utcnow()}
+            )
+    
     def record_trade(self, trade_data):
         """Record a trade"""
-        self.total_trades += 1
-        if trade_data.get('pnl', 0) > 0:
-            self.winning_trades += 1
-        else:
-            self.losing_trades += 1
+        UserBot.record_trades([(self.id, trade_data)])
+        # Read the new totals back from the database on next access
+        db.session.expire(self, ['total_trades', 'winning_trades', 'losing_trades',
+                                 'total_pnl', 'last_trade_time'])
+    
+    @classmethod
+    def record_trades(cls, trades):
+        """Record (bot_id, trade_data) pairs, adding each bot's totals in the database
         
-        self.total_pnl += trade_data.get('pnl', 0)
-        self.last_trade_time = datetime.utcnow()
-        self.save()
+        Deltas are summed per bot and sent as a single executemany UPDATE, so
+        counters can't lose increments to concurrent writers. Bots already
+        loaded in the session are not refreshed.
+        """
+        deltas = {}
+        for bot_id, trade_data in trades:
+            pnl = trade_data.get('pnl', 0)
+            delta = deltas.setdefault(bot_id, {'bot_id': bot_id, 'trades': 0,
+                                               'wins': 0, 'losses': 0, 'pnl': 0})
+            delta['trades'] += 1
+            if pnl > 0:
+                delta['wins'] += 1
+            else:
+                delta['losses'] += 1
+            delta['pnl'] += pnl
+        if not deltas:
+            return
+        
+        table = cls.__table__
+        db.session.flush()
+        db.session.execute(
+            update(table).where(table.c.id == bindparam('bot_id')).values(
+                total_trades=table.c.total_trades + bindparam('trades'),
+                winning_trades=table.c.winning_trades + bindparam('wins'),
+                losing_trades=table.c.losing_trades + bindparam('losses'),
+                total_pnl=table.c.total_pnl + bindparam('pnl'),
+                last_trade_time=datetime.utcnow(),
+            ),
+            list(deltas.values())
+        )
     
     @property
     def win_rate(self):
@@ -129,25 +129,31 @@ class User(BaseModel):
 
     def increment_api_calls(self):
         """Increment API calls counter"""
-        # Reset counter if it's a new hour
+        # Reset counter if it's a new hour. Done as one atomic UPDATE rather
+        # than read-modify-write, so concurrent requests can't lose calls
         now = datetime.utcnow()
-        if (now - self.api_calls_reset_at).total_seconds() >= 3600:
-            self.api_calls_count = 0
-            self.api_calls_reset_at = now
-
-        self.api_calls_count += 1
-        self.save()
+        new_window = User.api_calls_reset_at <= now - timedelta(hours=1)
+        User.query.filter_by(id=self.id).update(
+            {
+                User.api_calls_count: db.case(
+                    (new_window, 1), else_=User.api_calls_count + 1
+                ),
+                User.api_calls_reset_at: db.case(
+                    (new_window, now), else_=User.api_calls_reset_at
+                ),
+            },
+            synchronize_session=False,
+        )
+        # Read the new count back from the database on next access
+        db.session.expire(self, ["api_calls_count", "api_calls_reset_at"])
 
     def can_make_api_call(self):
         """Check if user can make API call based on plan limits"""
         if not self.subscription:
             return self.api_calls_count < 100  # Free plan limit
 
-        plan_limit = self.subscription.get_feature_value("api_calls_per_hour")
-        if plan_limit == "unlimited":
-            return True
-
-        return self.api_calls_count < int(plan_limit)
+        plan_limit = self.subscription.plan.api_calls_per_hour
+        return plan_limit is None or self.api_calls_count < plan_limit
 
     @property
     def full_name(self):
@@ -13,6 +13,13 @@ from flask_limiter.util import get_remote_address
 from flask_mail import Mail
 
 from src.models.base import db, init_db
+
+try:
+    import redis
+
+    REDIS_AVAILABLE = True
+except ImportError:
+    REDIS_AVAILABLE = False
 from src.api.v1 import api_v1
 from src.web.saas_dashboard import saas_dashboard_bp
 from src.web.admin_panel import admin_panel_bp
@@ -29,12 +36,18 @@ def create_app(config_name="development"):
     """Create and configure Flask application"""
     app = Flask(__name__)
 
+    database_url = os.getenv("DATABASE_URL", "sqlite:///saas_trading_bot.db")
+
+    # Send executemany INSERTs as multi-row VALUES batches
+    engine_options = {"insertmanyvalues_page_size": 1000}
+    if database_url.startswith("postgresql"):
+        engine_options["executemany_mode"] = "values_plus_batch"
+
     # Configuration
     app.config.update(
         # Database
-        SQLALCHEMY_DATABASE_URI=os.getenv(
-            "DATABASE_URL", "sqlite:///saas_trading_bot.db"
-        ),
+        SQLALCHEMY_DATABASE_URI=database_url,
+        SQLALCHEMY_ENGINE_OPTIONS=engine_options,
         SQLALCHEMY_TRACK_MODIFICATIONS=False,
         # JWT
         JWT_SECRET_KEY=os.getenv(
@@ -68,6 +81,24 @@ def create_app(config_name="development"):
     # Initialize extensions
     db.init_app(app)
 
+    # Redis cache for hot serialized data; models skip it when absent. Only
+    # an explicitly configured server is used, not the localhost default,
+    # so hosts without Redis don't pay a failed round trip per lookup
+    if REDIS_AVAILABLE and os.getenv("REDIS_URL"):
+        app.extensions["redis"] = redis.Redis.from_url(
+            app.config["REDIS_URL"], socket_connect_timeout=0.5, socket_timeout=0.5
+        )
+
+    # Model saves only flush; commit each request's changes once at the end,
+    # and discard them if the request failed
+    @app.after_request
+    def commit_session(response):
+        if response.status_code < 500:
+            db.session.commit()
+        else:
+            db.session.rollback()
+        return response
+
     # CORS
     CORS(app, origins=os.getenv("CORS_ORIGINS", "*").split(","))
 
@@ -155,7 +155,7 @@ def subscriptions_management():
         plan_filter = request.args.get('plan', '')
         status_filter = request.args.get('status', '')
         
-        query = Subscription.query.join(User).join(SubscriptionPlan)
+        query = Subscription.with_plan().join(User).join(SubscriptionPlan)
         
         if plan_filter:
             query = query.filter(SubscriptionPlan.name == plan_filter)
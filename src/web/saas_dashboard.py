@@ -21,7 +21,7 @@ saas_dashboard_bp = Blueprint('saas_dashboard', __name__, url_prefix='/', templa
 @saas_dashboard_bp.route('/')
 def landing_page():
     """Landing page for the SaaS platform"""
-    plans = SubscriptionPlan.query.filter_by(is_active=True).all()
+    plans = SubscriptionPlan.with_features().filter_by(is_active=True).all()
     return render_template('landing.html', plans=plans)
 
 
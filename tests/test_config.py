@@ -0,0 +1,36 @@
+#!/usr/bin/env python3
+"""
+Configuration Helper Tests
+"""
+import os
+import sys
+
+# Add the project root to the Python path
+project_root = os.path.dirname(os.path.dirname(__file__))
+sys.path.insert(0, project_root)
+
+from src.config._common import parse_trading_pair
+
+
+def test_parse_known_pair():
+    """Pairs in PAIR_MAP come straight from the table"""
+    assert parse_trading_pair("XBTMYR") == ("XBT", "MYR")
+    assert parse_trading_pair("ETHXBT") == ("ETH", "XBT")
+
+
+def test_parse_longest_base_prefix():
+    """Four-letter base currencies win over the 3/3 split"""
+    assert parse_trading_pair("USDCMYR") == ("USDC", "MYR")
+    assert parse_trading_pair("LINKZAR") == ("LINK", "ZAR")
+    assert parse_trading_pair("SOLMYR") == ("SOL", "MYR")
+
+
+def test_parse_prefix_needs_full_counter_currency():
+    """A prefix leaving fewer than three letters falls back to the 3/3 split"""
+    assert parse_trading_pair("USDCAD") == ("USD", "CAD")
+    assert parse_trading_pair("USDTRY") == ("USD", "TRY")
+
+
+def test_parse_unknown_pair_defaults():
+    """Unparseable pairs fall back to XBT/MYR"""
+    assert parse_trading_pair("XYZ") == ("XBT", "MYR")
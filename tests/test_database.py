@@ -0,0 +1,175 @@
+#!/usr/bin/env python3
+"""
+Database Manager Tests
+"""
+import os
+import sqlite3
+import sys
+import threading
+from datetime import datetime, timedelta
+
+# Add the project root to the Python path
+project_root = os.path.dirname(os.path.dirname(__file__))
+sys.path.insert(0, project_root)
+
+from src.database.database_manager import (
+    SCHEMA_VERSION,
+    DatabaseManager,
+    TradeRecord,
+    _from_epoch_us,
+    _to_epoch_us,
+)
+
+# Tables as created before timestamps became integer epoch microseconds
+BASELINE_SCHEMA = """
+    CREATE TABLE market_data (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        timestamp DATETIME NOT NULL,
+        pair TEXT NOT NULL,
+        open_price REAL NOT NULL,
+        high_price REAL NOT NULL,
+        low_price REAL NOT NULL,
+        close_price REAL NOT NULL,
+        volume REAL NOT NULL,
+        timeframe TEXT DEFAULT '1h',
+        created_at DATETIME DEFAULT CURRENT_TIMESTAMP,
+        UNIQUE(timestamp, pair, timeframe)
+    );
+    CREATE TABLE trades (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        trade_id TEXT UNIQUE NOT NULL,
+        timestamp DATETIME NOT NULL,
+        pair TEXT NOT NULL,
+        action TEXT NOT NULL,
+        volume REAL NOT NULL,
+        price REAL NOT NULL,
+        commission REAL DEFAULT 0,
+        pnl REAL DEFAULT 0,
+        strategy TEXT,
+        confidence REAL,
+        metadata TEXT,
+        created_at DATETIME DEFAULT CURRENT_TIMESTAMP
+    );
+    CREATE TABLE signals (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        timestamp DATETIME NOT NULL,
+        pair TEXT NOT NULL,
+        signal_type TEXT NOT NULL,
+        action TEXT NOT NULL,
+        confidence REAL NOT NULL,
+        price REAL NOT NULL,
+        indicators TEXT,
+        created_at DATETIME DEFAULT CURRENT_TIMESTAMP
+    );
+"""
+
+# Stored by the old code as str(datetime), with and without microseconds
+TIMESTAMPS = [
+    datetime(2024, 3, 1, 12, 0, 0),
+    datetime(2024, 3, 1, 12, 0, 0, 123456),
+    datetime(2024, 3, 1, 13, 30, 15, 500),
+]
+
+
+def make_baseline_db(path):
+    """Create a pre-migration database holding text timestamps"""
+    connection = sqlite3.connect(path)
+    connection.executescript(BASELINE_SCHEMA)
+    for i, timestamp in enumerate(TIMESTAMPS):
+        connection.execute(
+            "INSERT INTO market_data (timestamp, pair, open_price, high_price, "
+            "low_price, close_price, volume) VALUES (?, 'XBTMYR', 1, 1, 1, 1, 1)",
+            (str(timestamp),),
+        )
+        connection.execute(
+            "INSERT INTO trades (trade_id, timestamp, pair, action, volume, price) "
+            "VALUES (?, ?, 'XBTMYR', 'BUY', 0.01, 250000)",
+            (f"T{i}", str(timestamp)),
+        )
+    connection.commit()
+    assert connection.execute("PRAGMA user_version").fetchone()[0] == 0
+    connection.close()
+
+
+def test_migrates_text_timestamps(tmp_path):
+    """Opening a baseline database converts text timestamps to epoch µs"""
+    db_path = str(tmp_path / "baseline.db")
+    make_baseline_db(db_path)
+
+    manager = DatabaseManager(db_path)
+    try:
+        expected = [_to_epoch_us(timestamp) for timestamp in TIMESTAMPS]
+        for table in ("market_data", "trades"):
+            rows = manager.connection.execute(
+                f"SELECT timestamp, typeof(timestamp) FROM {table} ORDER BY id"
+            ).fetchall()
+            assert [row[0] for row in rows] == expected
+            assert {row[1] for row in rows} == {"integer"}
+            assert [_from_epoch_us(row[0]) for row in rows] == TIMESTAMPS
+
+        version = manager.connection.execute("PRAGMA user_version").fetchone()[0]
+        assert version == SCHEMA_VERSION == 1
+
+        # Converted rows are found by the integer range filters
+        trades = manager.get_trades(
+            pair="XBTMYR", start_time=TIMESTAMPS[1], end_time=TIMESTAMPS[2]
+        )
+        assert list(trades["trade_id"]) == ["T1", "T2"]
+        assert list(trades["timestamp"]) == TIMESTAMPS[1:]
+    finally:
+        manager.close()
+
+
+def test_migration_runs_once(tmp_path):
+    """A migrated database is left alone when reopened"""
+    db_path = str(tmp_path / "baseline.db")
+    make_baseline_db(db_path)
+    DatabaseManager(db_path).close()
+
+    manager = DatabaseManager(db_path)
+    try:
+        rows = manager.connection.execute(
+            "SELECT timestamp FROM trades ORDER BY id"
+        ).fetchall()
+        assert [row[0] for row in rows] == [
+            _to_epoch_us(timestamp) for timestamp in TIMESTAMPS
+        ]
+    finally:
+        manager.close()
+
+
+def make_trade(i, timestamp):
+    """A trade record with the given id suffix and time"""
+    return TradeRecord(
+        trade_id=f"T{i}", timestamp=timestamp, pair="XBTMYR", action="BUY",
+        volume=0.01, price=250000, commission=0, pnl=i, strategy="test",
+        confidence=0.5, metadata={"i": i},
+    )
+
+
+def test_iter_trades_pages_release_the_connection():
+    """Chunks match get_trades and writers are not blocked between chunks"""
+    manager = DatabaseManager(":memory:")
+    try:
+        start = datetime(2024, 3, 1)
+        # Three trades share each timestamp, so pages break inside a tie
+        for i in range(25):
+            manager.store_trade(make_trade(i, start + timedelta(hours=i // 3)))
+
+        chunks = manager.iter_trades(pair="XBTMYR", chunksize=4)
+        first = next(chunks)
+
+        writer = threading.Thread(
+            target=manager.store_trade, args=(make_trade(99, start),)
+        )
+        writer.start()
+        writer.join(5)
+        assert not writer.is_alive()
+
+        streamed = [first] + list(chunks)
+        assert [len(chunk) for chunk in streamed] == [4] * 6 + [1]
+        trade_ids = [t for chunk in streamed for t in chunk["trade_id"]]
+        assert trade_ids == [f"T{i}" for i in range(25)]
+        assert list(streamed[0].columns) == list(manager.get_trades().columns)
+    finally:
+        manager.close()
@@ -0,0 +1,109 @@
+#!/usr/bin/env python3
+"""
+Incremental Indicator Parity Tests
+"""
+import importlib
+import os
+import sys
+from types import SimpleNamespace
+
+import numpy as np
+import pytest
+
+# Add the project root to the Python path
+project_root = os.path.dirname(os.path.dirname(__file__))
+sys.path.insert(0, project_root)
+
+from src.bot import technical_analysis
+
+INDICATOR_FIELDS = (
+    "rsi",
+    "ema_short",
+    "ema_long",
+    "bollinger_upper",
+    "bollinger_middle",
+    "bollinger_lower",
+    "macd",
+    "macd_signal",
+    "macd_histogram",
+)
+
+
+def make_candles(count, seed=7):
+    """Random-walk candles around a BTC-like price"""
+    rng = np.random.default_rng(seed)
+    closes = 250000 + np.cumsum(rng.normal(0, 800, count))
+    volumes = rng.uniform(0.5, 5.0, count)
+    return [
+        {"timestamp": 1700000000 + i * 3600, "close": close, "volume": volume}
+        for i, (close, volume) in enumerate(zip(closes, volumes))
+    ]
+
+
+@pytest.fixture(params=["numba", "python"])
+def module(request, monkeypatch):
+    """technical_analysis with and without the numba kernels"""
+    if request.param == "numba":
+        pytest.importorskip("numba")
+        yield technical_analysis
+        return
+
+    monkeypatch.setitem(sys.modules, "numba", None)
+    fallback = importlib.reload(technical_analysis)
+    assert not fallback.NUMBA_AVAILABLE
+    yield fallback
+    monkeypatch.undo()
+    importlib.reload(technical_analysis)
+
+
+@pytest.mark.parametrize("count", [5, 19, 30, 120])
+def test_update_tick_matches_full_recompute(module, count):
+    """update_tick treats the live price as the forming candle"""
+    config = SimpleNamespace(rsi_period=14, ema_short=9, ema_long=21)
+    analyzer = module.TechnicalAnalyzer(config)
+    candles = make_candles(count)
+    current_price = candles[-1]["close"] + 1234.5
+
+    analyzer.seed_indicator_state(candles)
+    assert not analyzer.needs_state_refresh(candles)
+    incremental = analyzer.update_tick(current_price)
+
+    forming = {"timestamp": None, "close": current_price, "volume": 0.0}
+    full = analyzer.analyze_market_data(candles + [forming], current_price, [])
+
+    for field in INDICATOR_FIELDS:
+        assert getattr(incremental, field) == pytest.approx(
+            getattr(full, field), abs=0.011
+        ), field
+
+    volumes = [candle["volume"] for candle in candles]
+    assert incremental.volume_sma == pytest.approx(np.mean(volumes[-7:]))
+
+
+def test_needs_state_refresh_on_new_candle(module):
+    """A new closed candle invalidates the seeded state"""
+    config = SimpleNamespace(rsi_period=14, ema_short=9, ema_long=21)
+    analyzer = module.TechnicalAnalyzer(config)
+    candles = make_candles(40)
+
+    assert analyzer.needs_state_refresh(candles)
+    analyzer.seed_indicator_state(candles[:-1])
+    assert analyzer.needs_state_refresh(candles)
+    analyzer.seed_indicator_state(candles)
+    assert not analyzer.needs_state_refresh(candles)
+
+
+def test_python_kernels_match_numba():
+    """The pure-Python loops behind njit agree with the compiled kernels"""
+    pytest.importorskip("numba")
+    prices = np.array([candle["close"] for candle in make_candles(60)])
+
+    assert technical_analysis._rsi_loop.py_func(prices, 14) == pytest.approx(
+        technical_analysis._rsi_loop(prices, 14)
+    )
+    assert technical_analysis._ema_loop.py_func(prices, 0.2) == pytest.approx(
+        technical_analysis._ema_loop(prices, 0.2)
+    )
+    assert technical_analysis._macd_loop.py_func(prices, 12, 26) == pytest.approx(
+        technical_analysis._macd_loop(prices, 12, 26)
+    )